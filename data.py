@@ -5,777 +5,132 @@ Extends existing test cases to create a robust training dataset
 """
 
 from models import ToolIntent, Language, AccuracyTestCase
-from typing import List, Dict, Tuple
+from typing import List, Dict, Tuple, Iterator
+from collections import Counter
+from functools import lru_cache
+from itertools import chain
+from operator import itemgetter
 import json
+import os
+import sys
+
+try:
+    import orjson  # Fast UTF-8 codec, keeps Devanagari out of Python's escape loop
+except ImportError:
+    orjson = None
+
+# Static corpus rows are stored in the exact field order of a training record:
+# (text, intent, tool, language, description)
+ExampleRow = Tuple[str, str, str, str, str]
+RECORD_KEYS = ("text", "intent", "tool", "language", "description")
+
+# Hand-curated examples live next to this module, grouped by section
+CORPUS_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "intent_corpus.json")
+
+@lru_cache(maxsize=1)
+def _load_corpus() -> Dict[str, Tuple[ExampleRow, ...]]:
+    """Load the example corpus on first use, keeping its section order"""
+    with open(CORPUS_PATH, 'rb') as f:
+        raw = f.read()
+    sections = orjson.loads(raw) if orjson is not None else json.loads(raw)
+    
+    # The JSON decoder allocates a fresh str for every value; intern the
+    # low-cardinality label columns so all rows share one object per label
+    return {
+        name: tuple(
+            (text, sys.intern(intent), sys.intern(tool), sys.intern(language), description)
+            for text, intent, tool, language, description in rows
+        )
+        for name, rows in sections.items()
+    }
+
+def _record_keys(include_description: bool) -> Tuple[str, ...]:
+    """Record keys to emit; description is always the last field"""
+    return RECORD_KEYS if include_description else RECORD_KEYS[:-1]
+
+@lru_cache(maxsize=1)
+def _unique_rows() -> Tuple[ExampleRow, ...]:
+    """Corpus rows with duplicate texts removed, first occurrence wins"""
+    # Stream every corpus section (base, extended, code-mixed, realistic,
+    # edge cases, conversation, formal, enhanced) in order; dicts preserve
+    # insertion order, so keying by text dedups in the same pass
+    unique_rows = {}
+    for row in chain.from_iterable(_load_corpus().values()):
+        if row[0] not in unique_rows:
+            unique_rows[row[0]] = row
+    return tuple(unique_rows.values())
+
+def _dump_line(record: Dict) -> bytes:
+    """Compact UTF-8 JSON for a single record"""
+    if orjson is not None:
+        return orjson.dumps(record)
+    return json.dumps(record, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
+def label_distribution(training_data: List[Dict]) -> Tuple[Counter, Counter]:
+    """Count examples per intent and per language, in first-seen order"""
+    # One pass over the records, then fold the few (intent, language) pairs;
+    # pairs keep first-seen order, so the marginals do too
+    pair_counts = Counter(map(itemgetter('intent', 'language'), training_data))
+    intent_counts = Counter()
+    language_counts = Counter()
+    for (intent, language), count in pair_counts.items():
+        intent_counts[intent] += count
+        language_counts[language] += count
+    return intent_counts, language_counts
 
 class IntentDatasetGenerator:
     """Generate comprehensive training dataset for intent classification"""
     
-    def __init__(self):
-        self.intent_to_tool = {
-            ToolIntent.RECIPE_SUGGESTION: "leftover_chef",
-            ToolIntent.STORY_TELLING: "nani_kahaniyan", 
-            ToolIntent.POEM_GENERATION: "poem_generator",
-            ToolIntent.MUSIC_RECOMMENDATION: "vividh_bharti",
-            ToolIntent.FOOD_LOCATION: "food_locator"
-        }
-    
-    def generate_training_data(self) -> List[Dict]:
-        """Generate comprehensive training dataset"""
-        
-        # Base examples from existing test cases
-        base_examples = self._get_base_examples()
-        
-        # Extended examples for better coverage
-        extended_examples = self._get_extended_examples()
-        
-        # Code-mixed challenging examples
-        code_mixed_examples = self._get_code_mixed_examples()
-        
-        # NEW: More realistic user scenarios
-        realistic_examples = self._get_realistic_scenarios()
-        
-        # NEW: Edge cases and variations
-        edge_case_examples = self._get_edge_cases()
-        
-        # NEW: Natural conversation patterns
-        conversation_examples = self._get_conversation_patterns()
-        
-        # NEW: Professional and formal variations
-        formal_examples = self._get_formal_variations()
-        
-        # NEW: Enhanced training examples
-        enhanced_examples = self._get_enhanced_training_examples()
-        
-        # Combine all examples
-        all_examples = (base_examples + extended_examples + code_mixed_examples + 
-                       realistic_examples + edge_case_examples + conversation_examples + formal_examples + enhanced_examples)
-        
-        # Convert to training format
-        training_data = []
-        for example in all_examples:
-            training_data.append({
-                "text": example.input_text,
-                "intent": example.expected_intent.value,
-                "tool": example.expected_tool,
-                "language": example.language.value,
-                "description": example.description
-            })
-        
-        # Remove duplicates while preserving order
-        seen = set()
-        unique_training_data = []
-        for item in training_data:
-            if item["text"] not in seen:
-                seen.add(item["text"])
-                unique_training_data.append(item)
-        
-        return unique_training_data
-    
-    def _get_base_examples(self) -> List[AccuracyTestCase]:
-        """Base examples from existing test dataset"""
-        return [
-            # Recipe Tool Tests - English
-            AccuracyTestCase(input_text="What can I cook with leftover rice and dal?", expected_tool="leftover_chef", expected_intent=ToolIntent.RECIPE_SUGGESTION, language=Language.ENGLISH, description="English recipe query"),
-            AccuracyTestCase(input_text="How to cook with remaining vegetables?", expected_tool="leftover_chef", expected_intent=ToolIntent.RECIPE_SUGGESTION, language=Language.ENGLISH, description="English leftover vegetables"),
-            AccuracyTestCase(input_text="Recipe for leftover bread", expected_tool="leftover_chef", expected_intent=ToolIntent.RECIPE_SUGGESTION, language=Language.ENGLISH, description="English bread recipe"),
-            AccuracyTestCase(input_text="What to make with leftover food?", expected_tool="leftover_chef", expected_intent=ToolIntent.RECIPE_SUGGESTION, language=Language.ENGLISH, description="General leftover query"),
-            
-            # Recipe Tool Tests - Hindi
-            AccuracyTestCase(input_text="बचे हुए खाने से क्या बना सकते हैं?", expected_tool="leftover_chef", expected_intent=ToolIntent.RECIPE_SUGGESTION, language=Language.HINDI, description="Hindi recipe query"),
-            AccuracyTestCase(input_text="चावल और दाल से कुछ बनाना है", expected_tool="leftover_chef", expected_intent=ToolIntent.RECIPE_SUGGESTION, language=Language.HINDI, description="Hindi rice dal recipe"),
-            AccuracyTestCase(input_text="बची हुई रोटी का क्या करें?", expected_tool="leftover_chef", expected_intent=ToolIntent.RECIPE_SUGGESTION, language=Language.HINDI, description="Hindi leftover roti"),
-            
-            # Recipe Tool Tests - Hinglish
-            AccuracyTestCase(input_text="Ghar mein sirf chawal aur dal hai, kuch recipe batao", expected_tool="leftover_chef", expected_intent=ToolIntent.RECIPE_SUGGESTION, language=Language.HINGLISH, description="Hinglish recipe query"),
-            AccuracyTestCase(input_text="Leftover roti se kya banau?", expected_tool="leftover_chef", expected_intent=ToolIntent.RECIPE_SUGGESTION, language=Language.HINGLISH, description="Leftover roti query"),
-            AccuracyTestCase(input_text="Dal chawal se kya banana hai", expected_tool="leftover_chef", expected_intent=ToolIntent.RECIPE_SUGGESTION, language=Language.HINGLISH, description="Specific Hinglish recipe query"),
-            AccuracyTestCase(input_text="Bacha hua khana waste nahi karna, recipe batao", expected_tool="leftover_chef", expected_intent=ToolIntent.RECIPE_SUGGESTION, language=Language.HINGLISH, description="Food waste prevention"),
-            
-            # Story Tool Tests - English
-            AccuracyTestCase(input_text="Tell me a bedtime story", expected_tool="nani_kahaniyan", expected_intent=ToolIntent.STORY_TELLING, language=Language.ENGLISH, description="English bedtime story"),
-            AccuracyTestCase(input_text="Share a moral story for children", expected_tool="nani_kahaniyan", expected_intent=ToolIntent.STORY_TELLING, language=Language.ENGLISH, description="English moral story"),
-            AccuracyTestCase(input_text="I need a story for kids", expected_tool="nani_kahaniyan", expected_intent=ToolIntent.STORY_TELLING, language=Language.ENGLISH, description="English kids story"),
-            AccuracyTestCase(input_text="Bedtime tale please", expected_tool="nani_kahaniyan", expected_intent=ToolIntent.STORY_TELLING, language=Language.ENGLISH, description="English bedtime tale"),
-            
-            # Story Tool Tests - Hindi  
-            AccuracyTestCase(input_text="कोई नैतिक कहानी सुनाइए", expected_tool="nani_kahaniyan", expected_intent=ToolIntent.STORY_TELLING, language=Language.HINDI, description="Hindi moral story"),
-            AccuracyTestCase(input_text="बच्चों के लिए कहानी चाहिए", expected_tool="nani_kahaniyan", expected_intent=ToolIntent.STORY_TELLING, language=Language.HINDI, description="Hindi children story"),
-            AccuracyTestCase(input_text="सोने से पहले की कहानी बताइए", expected_tool="nani_kahaniyan", expected_intent=ToolIntent.STORY_TELLING, language=Language.HINDI, description="Hindi bedtime story"),
-            
-            # Story Tool Tests - Hinglish
-            AccuracyTestCase(input_text="Bacchon ko sunane ke liye koi achhi kahani batao", expected_tool="nani_kahaniyan", expected_intent=ToolIntent.STORY_TELLING, language=Language.HINGLISH, description="Hinglish children story"),
-            AccuracyTestCase(input_text="Story with moral sunao", expected_tool="nani_kahaniyan", expected_intent=ToolIntent.STORY_TELLING, language=Language.HINGLISH, description="Hinglish moral story"),
-            AccuracyTestCase(input_text="Bacchon ke liye moral story batao", expected_tool="nani_kahaniyan", expected_intent=ToolIntent.STORY_TELLING, language=Language.HINGLISH, description="Hinglish children story request"),
-            AccuracyTestCase(input_text="Nani ki kahani sunao na", expected_tool="nani_kahaniyan", expected_intent=ToolIntent.STORY_TELLING, language=Language.HINGLISH, description="Traditional grandmother story"),
-            
-            # Poem Tool Tests - English
-            AccuracyTestCase(input_text="Write a beautiful poem", expected_tool="poem_generator", expected_intent=ToolIntent.POEM_GENERATION, language=Language.ENGLISH, description="English poem request"),
-            AccuracyTestCase(input_text="Create romantic poetry", expected_tool="poem_generator", expected_intent=ToolIntent.POEM_GENERATION, language=Language.ENGLISH, description="English romantic poem"),
-            AccuracyTestCase(input_text="Generate verse about love", expected_tool="poem_generator", expected_intent=ToolIntent.POEM_GENERATION, language=Language.ENGLISH, description="English love verse"),
-            AccuracyTestCase(input_text="I want some poetry", expected_tool="poem_generator", expected_intent=ToolIntent.POEM_GENERATION, language=Language.ENGLISH, description="General poetry request"),
-            
-            # Poem Tool Tests - Hindi
-            AccuracyTestCase(input_text="प्रेम पर कविता लिखिए", expected_tool="poem_generator", expected_intent=ToolIntent.POEM_GENERATION, language=Language.HINDI, description="Hindi love poem"),
-            AccuracyTestCase(input_text="कोई अच्छी कविता सुनाइए", expected_tool="poem_generator", expected_intent=ToolIntent.POEM_GENERATION, language=Language.HINDI, description="Hindi poem request"),
-            AccuracyTestCase(input_text="शायरी सुनाना चाहते हैं", expected_tool="poem_generator", expected_intent=ToolIntent.POEM_GENERATION, language=Language.HINDI, description="Hindi shayari request"),
-            
-            # Poem Tool Tests - Hinglish
-            AccuracyTestCase(input_text="Koi achhi kavita sunao", expected_tool="poem_generator", expected_intent=ToolIntent.POEM_GENERATION, language=Language.HINGLISH, description="Hinglish poem request"),
-            AccuracyTestCase(input_text="Romantic poetry batao", expected_tool="poem_generator", expected_intent=ToolIntent.POEM_GENERATION, language=Language.HINGLISH, description="Hinglish romantic poem"),
-            AccuracyTestCase(input_text="Koi achhi si kavita sunao na", expected_tool="poem_generator", expected_intent=ToolIntent.POEM_GENERATION, language=Language.HINGLISH, description="Casual Hinglish poem request"),
-            AccuracyTestCase(input_text="Love pe poem likhkar sunao", expected_tool="poem_generator", expected_intent=ToolIntent.POEM_GENERATION, language=Language.HINGLISH, description="Love poem in Hinglish"),
-            
-            # Music Tool Tests - English
-            AccuracyTestCase(input_text="Suggest some old classic songs", expected_tool="vividh_bharti", expected_intent=ToolIntent.MUSIC_RECOMMENDATION, language=Language.ENGLISH, description="English music request"),
-            AccuracyTestCase(input_text="Recommend nostalgic music", expected_tool="vividh_bharti", expected_intent=ToolIntent.MUSIC_RECOMMENDATION, language=Language.ENGLISH, description="English nostalgic music"),
-            AccuracyTestCase(input_text="Play vintage songs", expected_tool="vividh_bharti", expected_intent=ToolIntent.MUSIC_RECOMMENDATION, language=Language.ENGLISH, description="English vintage music"),
-            AccuracyTestCase(input_text="Old bollywood hits please", expected_tool="vividh_bharti", expected_intent=ToolIntent.MUSIC_RECOMMENDATION, language=Language.ENGLISH, description="English old bollywood"),
-            
-            # Music Tool Tests - Hindi
-            AccuracyTestCase(input_text="कुछ पुराने गाने बताइए", expected_tool="vividh_bharti", expected_intent=ToolIntent.MUSIC_RECOMMENDATION, language=Language.HINDI, description="Hindi music request"),
-            AccuracyTestCase(input_text="क्लासिक संगीत की सिफारिश करें", expected_tool="vividh_bharti", expected_intent=ToolIntent.MUSIC_RECOMMENDATION, language=Language.HINDI, description="Hindi classic music"),
-            AccuracyTestCase(input_text="नॉस्टेल्जिक गाने चाहिए", expected_tool="vividh_bharti", expected_intent=ToolIntent.MUSIC_RECOMMENDATION, language=Language.HINDI, description="Hindi nostalgic songs"),
-            
-            # Music Tool Tests - Hinglish
-            AccuracyTestCase(input_text="Purane gaane recommend karo", expected_tool="vividh_bharti", expected_intent=ToolIntent.MUSIC_RECOMMENDATION, language=Language.HINGLISH, description="Hinglish music request"),
-            AccuracyTestCase(input_text="1900s ke nostalgic songs batao", expected_tool="vividh_bharti", expected_intent=ToolIntent.MUSIC_RECOMMENDATION, language=Language.HINGLISH, description="Nostalgic songs request"),
-            AccuracyTestCase(input_text="Purane gaane recommend karo yaar", expected_tool="vividh_bharti", expected_intent=ToolIntent.MUSIC_RECOMMENDATION, language=Language.HINGLISH, description="Challenging Hinglish music request"),
-            AccuracyTestCase(input_text="Old classic music sunana hai", expected_tool="vividh_bharti", expected_intent=ToolIntent.MUSIC_RECOMMENDATION, language=Language.HINGLISH, description="Mixed language music request"),
-            
-            # Food Location Tests - English
-            AccuracyTestCase(input_text="Good restaurants near me", expected_tool="food_locator", expected_intent=ToolIntent.FOOD_LOCATION, language=Language.ENGLISH, description="English restaurant search"),
-            AccuracyTestCase(input_text="Find nearby food places", expected_tool="food_locator", expected_intent=ToolIntent.FOOD_LOCATION, language=Language.ENGLISH, description="English food search"),
-            AccuracyTestCase(input_text="Where to eat around here?", expected_tool="food_locator", expected_intent=ToolIntent.FOOD_LOCATION, language=Language.ENGLISH, description="English dining query"),
-            AccuracyTestCase(input_text="Suggest local restaurants", expected_tool="food_locator", expected_intent=ToolIntent.FOOD_LOCATION, language=Language.ENGLISH, description="English local restaurants"),
-            
-            # Food Location Tests - Hindi
-            AccuracyTestCase(input_text="पास में खाने की जगह बताइए", expected_tool="food_locator", expected_intent=ToolIntent.FOOD_LOCATION, language=Language.HINDI, description="Hindi food place search"),
-            AccuracyTestCase(input_text="यहाँ के आस-पास रेस्टोरेंट कहाँ है?", expected_tool="food_locator", expected_intent=ToolIntent.FOOD_LOCATION, language=Language.HINDI, description="Hindi restaurant query"),
-            AccuracyTestCase(input_text="नजदीकी भोजनालय बताएं", expected_tool="food_locator", expected_intent=ToolIntent.FOOD_LOCATION, language=Language.HINDI, description="Hindi dining places"),
-            
-            # Food Location Tests - Hinglish
-            AccuracyTestCase(input_text="Yahan ke paas koi achha dhaba hai?", expected_tool="food_locator", expected_intent=ToolIntent.FOOD_LOCATION, language=Language.HINGLISH, description="Hinglish dhaba search"),
-            AccuracyTestCase(input_text="Nearby food places batao", expected_tool="food_locator", expected_intent=ToolIntent.FOOD_LOCATION, language=Language.HINGLISH, description="Hinglish food search"),
-            AccuracyTestCase(input_text="Yahan ka food scene kaisa hai", expected_tool="food_locator", expected_intent=ToolIntent.FOOD_LOCATION, language=Language.HINGLISH, description="Complex Hinglish food inquiry"),
-            AccuracyTestCase(input_text="Koi achha restaurant suggest karo nearby", expected_tool="food_locator", expected_intent=ToolIntent.FOOD_LOCATION, language=Language.HINGLISH, description="Restaurant suggestion in Hinglish"),
-        ]
-    
-    def _get_extended_examples(self) -> List[AccuracyTestCase]:
-        """Extended examples for better coverage"""
-        return [
-            # More Recipe Variations
-            AccuracyTestCase(input_text="I have some leftover chicken, what should I make?", expected_tool="leftover_chef", expected_intent=ToolIntent.RECIPE_SUGGESTION, language=Language.ENGLISH, description="Leftover chicken recipe"),
-            AccuracyTestCase(input_text="कल का बना खाना बचा है, क्या करूं?", expected_tool="leftover_chef", expected_intent=ToolIntent.RECIPE_SUGGESTION, language=Language.HINDI, description="Yesterday's leftover food"),
-            AccuracyTestCase(input_text="Fridge mein kuch vegetables hai, recipe suggest karo", expected_tool="leftover_chef", expected_intent=ToolIntent.RECIPE_SUGGESTION, language=Language.HINGLISH, description="Fridge vegetables recipe"),
-            AccuracyTestCase(input_text="Bread ke टुकड़े बचे हैं, kya banau?", expected_tool="leftover_chef", expected_intent=ToolIntent.RECIPE_SUGGESTION, language=Language.HINGLISH, description="Leftover bread pieces"),
-            AccuracyTestCase(input_text="Quick meal banana hai leftover se", expected_tool="leftover_chef", expected_intent=ToolIntent.RECIPE_SUGGESTION, language=Language.HINGLISH, description="Quick leftover meal"),
-            
-            # More Story Variations
-            AccuracyTestCase(input_text="Can you narrate a folk tale?", expected_tool="nani_kahaniyan", expected_intent=ToolIntent.STORY_TELLING, language=Language.ENGLISH, description="English folk tale"),
-            AccuracyTestCase(input_text="परी की कहानी सुनाइए", expected_tool="nani_kahaniyan", expected_intent=ToolIntent.STORY_TELLING, language=Language.HINDI, description="Hindi fairy tale"),
-            AccuracyTestCase(input_text="Bachpan ki yaad dilane wali story sunao", expected_tool="nani_kahaniyan", expected_intent=ToolIntent.STORY_TELLING, language=Language.HINGLISH, description="Childhood memory story"),
-            AccuracyTestCase(input_text="Moral wali कोई interesting कहानी है?", expected_tool="nani_kahaniyan", expected_intent=ToolIntent.STORY_TELLING, language=Language.HINGLISH, description="Interesting moral story"),
-            AccuracyTestCase(input_text="Kids ke लिए educational story batao", expected_tool="nani_kahaniyan", expected_intent=ToolIntent.STORY_TELLING, language=Language.HINGLISH, description="Educational kids story"),
-            
-            # More Poem Variations  
-            AccuracyTestCase(input_text="Compose a verse about nature", expected_tool="poem_generator", expected_intent=ToolIntent.POEM_GENERATION, language=Language.ENGLISH, description="Nature verse"),
-            AccuracyTestCase(input_text="दोस्ती पर कविता लिखिए", expected_tool="poem_generator", expected_intent=ToolIntent.POEM_GENERATION, language=Language.HINDI, description="Friendship poem in Hindi"),
-            AccuracyTestCase(input_text="Monsoon ke मूड में कोई poem sunao", expected_tool="poem_generator", expected_intent=ToolIntent.POEM_GENERATION, language=Language.HINGLISH, description="Monsoon mood poem"),
-            AccuracyTestCase(input_text="Heart-touching shayari chahiye", expected_tool="poem_generator", expected_intent=ToolIntent.POEM_GENERATION, language=Language.HINGLISH, description="Heart-touching shayari"),
-            AccuracyTestCase(input_text="Life pe deep poetry create karo", expected_tool="poem_generator", expected_intent=ToolIntent.POEM_GENERATION, language=Language.HINGLISH, description="Deep life poetry"),
-            
-            # More Music Variations
-            AccuracyTestCase(input_text="Play some retro melodies", expected_tool="vividh_bharti", expected_intent=ToolIntent.MUSIC_RECOMMENDATION, language=Language.ENGLISH, description="Retro melodies"),
-            AccuracyTestCase(input_text="सुनहरे दिनों के गाने सुनाइए", expected_tool="vividh_bharti", expected_intent=ToolIntent.MUSIC_RECOMMENDATION, language=Language.HINDI, description="Golden era songs"),
-            AccuracyTestCase(input_text="90s के hit songs recommend karo", expected_tool="vividh_bharti", expected_intent=ToolIntent.MUSIC_RECOMMENDATION, language=Language.HINGLISH, description="90s hit songs"),
-            AccuracyTestCase(input_text="Mood बनाने के लिए classic music चाहिए", expected_tool="vividh_bharti", expected_intent=ToolIntent.MUSIC_RECOMMENDATION, language=Language.HINGLISH, description="Mood classic music"),
-            AccuracyTestCase(input_text="Evergreen melodies ki list banao", expected_tool="vividh_bharti", expected_intent=ToolIntent.MUSIC_RECOMMENDATION, language=Language.HINGLISH, description="Evergreen melodies list"),
-            
-            # More Food Location Variations
-            AccuracyTestCase(input_text="Where can I find authentic cuisine?", expected_tool="food_locator", expected_intent=ToolIntent.FOOD_LOCATION, language=Language.ENGLISH, description="Authentic cuisine search"),
-            AccuracyTestCase(input_text="इस इलाके में अच्छा खाना कहाँ मिलता है?", expected_tool="food_locator", expected_intent=ToolIntent.FOOD_LOCATION, language=Language.HINDI, description="Good food in area"),
-            AccuracyTestCase(input_text="Budget-friendly restaurants batao nearby", expected_tool="food_locator", expected_intent=ToolIntent.FOOD_LOCATION, language=Language.HINGLISH, description="Budget restaurants"),
-            AccuracyTestCase(input_text="Home delivery वाले restaurants कौन से हैं?", expected_tool="food_locator", expected_intent=ToolIntent.FOOD_LOCATION, language=Language.HINGLISH, description="Home delivery restaurants"),
-            AccuracyTestCase(input_text="Street food के लिए कहाँ जाना चाहिए?", expected_tool="food_locator", expected_intent=ToolIntent.FOOD_LOCATION, language=Language.HINGLISH, description="Street food location"),
-        ]
-    
-    def _get_code_mixed_examples(self) -> List[AccuracyTestCase]:
-        """Challenging code-mixed examples"""
-        return [
-            # Complex code-switching patterns
-            AccuracyTestCase(input_text="Yesterday का बचा हुआ food से something tasty बनाओ", expected_tool="leftover_chef", expected_intent=ToolIntent.RECIPE_SUGGESTION, language=Language.HINGLISH, description="Complex code-mixed recipe"),
-            AccuracyTestCase(input_text="Kids को सुनाने के लिए some moral story with happy ending चाहिए", expected_tool="nani_kahaniyan", expected_intent=ToolIntent.STORY_TELLING, language=Language.HINGLISH, description="Code-mixed story request"),
-            AccuracyTestCase(input_text="Heart को touch करने वाली poetry create करो please", expected_tool="poem_generator", expected_intent=ToolIntent.POEM_GENERATION, language=Language.HINGLISH, description="Heart-touching poetry"),
-            AccuracyTestCase(input_text="Nostalgic feel देने वाले classic गाने play करो", expected_tool="vividh_bharti", expected_intent=ToolIntent.MUSIC_RECOMMENDATION, language=Language.HINGLISH, description="Nostalgic classic songs"),
-            AccuracyTestCase(input_text="यहाँ से walking distance में कोई good restaurant है?", expected_tool="food_locator", expected_intent=ToolIntent.FOOD_LOCATION, language=Language.HINGLISH, description="Walking distance restaurants"),
-            
-            # Regional variations
-            AccuracyTestCase(input_text="Aaj dinner mein kya banayega leftover rice se?", expected_tool="leftover_chef", expected_intent=ToolIntent.RECIPE_SUGGESTION, language=Language.HINGLISH, description="Dinner with leftover rice"),
-            AccuracyTestCase(input_text="Chote bacchon को interesting kahani with animals sunao", expected_tool="nani_kahaniyan", expected_intent=ToolIntent.STORY_TELLING, language=Language.HINGLISH, description="Animal stories for kids"),
-            AccuracyTestCase(input_text="Love mein धोखा खाने पर sad poetry likh do", expected_tool="poem_generator", expected_intent=ToolIntent.POEM_GENERATION, language=Language.HINGLISH, description="Sad love poetry"),
-            AccuracyTestCase(input_text="Sunday morning के लिए soothing old songs बताओ", expected_tool="vividh_bharti", expected_intent=ToolIntent.MUSIC_RECOMMENDATION, language=Language.HINGLISH, description="Sunday morning songs"),
-            AccuracyTestCase(input_text="Family के साथ dinner करने के लिए nice place suggest करो", expected_tool="food_locator", expected_intent=ToolIntent.FOOD_LOCATION, language=Language.HINGLISH, description="Family dinner place"),
-            
-            # Informal expressions
-            AccuracyTestCase(input_text="Yaar ghar pe sirf टमाटर और onion है, कुछ बना do", expected_tool="leftover_chef", expected_intent=ToolIntent.RECIPE_SUGGESTION, language=Language.HINGLISH, description="Informal recipe request"),
-            AccuracyTestCase(input_text="Bore हो रहा हूँ, कोई मजेदार story सुना na", expected_tool="nani_kahaniyan", expected_intent=ToolIntent.STORY_TELLING, language=Language.HINGLISH, description="Informal story request"),
-            AccuracyTestCase(input_text="Girlfriend को impress करने के लिए romantic poem लिख de", expected_tool="poem_generator", expected_intent=ToolIntent.POEM_GENERATION, language=Language.HINGLISH, description="Girlfriend poem"),
-            AccuracyTestCase(input_text="Road trip के time sunने के लिए peppy songs recommend kar", expected_tool="vividh_bharti", expected_intent=ToolIntent.MUSIC_RECOMMENDATION, language=Language.HINGLISH, description="Road trip songs"),
-            AccuracyTestCase(input_text="Date पर ले जाने के लिए romantic restaurant बता यहाँ का", expected_tool="food_locator", expected_intent=ToolIntent.FOOD_LOCATION, language=Language.HINGLISH, description="Date restaurant"),
-        ]
-    
-    def _get_realistic_scenarios(self) -> List[AccuracyTestCase]:
-        """More realistic user scenarios"""
-        return [
-            # Recipe scenarios - realistic contexts
-            AccuracyTestCase(input_text="I'm tired and just want something easy to cook with what I have", expected_tool="leftover_chef", expected_intent=ToolIntent.RECIPE_SUGGESTION, language=Language.ENGLISH, description="Tired easy cooking"),
-            AccuracyTestCase(input_text="My kids are hungry but I only have these leftovers", expected_tool="leftover_chef", expected_intent=ToolIntent.RECIPE_SUGGESTION, language=Language.ENGLISH, description="Kids hungry leftovers"),
-            AccuracyTestCase(input_text="Weekend mein friends ke liye kuch special banana hai", expected_tool="leftover_chef", expected_intent=ToolIntent.RECIPE_SUGGESTION, language=Language.HINGLISH, description="Weekend friends cooking"),
-            AccuracyTestCase(input_text="Grocery shopping nahi kar payi, ghar mein jo hai usse kuch banao", expected_tool="leftover_chef", expected_intent=ToolIntent.RECIPE_SUGGESTION, language=Language.HINGLISH, description="No grocery shopping"),
-            AccuracyTestCase(input_text="रात को देर से घर आया हूं, कुछ जल्दी बनाना है", expected_tool="leftover_chef", expected_intent=ToolIntent.RECIPE_SUGGESTION, language=Language.HINDI, description="Late night quick food"),
-            AccuracyTestCase(input_text="Guest aa rahe hain kal, leftover se kuch presentable banao", expected_tool="leftover_chef", expected_intent=ToolIntent.RECIPE_SUGGESTION, language=Language.HINGLISH, description="Guests coming tomorrow"),
-
-            # Story scenarios - bedtime, teaching, entertainment
-            AccuracyTestCase(input_text="My daughter can't sleep, she needs a calming story", expected_tool="nani_kahaniyan", expected_intent=ToolIntent.STORY_TELLING, language=Language.ENGLISH, description="Daughter can't sleep"),
-            AccuracyTestCase(input_text="बच्चा बहुत शैतान है, कोई अच्छी सीख देने वाली कहानी", expected_tool="nani_kahaniyan", expected_intent=ToolIntent.STORY_TELLING, language=Language.HINDI, description="Naughty child moral story"),
-            AccuracyTestCase(input_text="Kids bore ho rahe hain, koi entertaining story sunao", expected_tool="nani_kahaniyan", expected_intent=ToolIntent.STORY_TELLING, language=Language.HINGLISH, description="Kids getting bored"),
-            AccuracyTestCase(input_text="Rainy day hai, bachon ko ghar mein busy rakhne ke liye story", expected_tool="nani_kahaniyan", expected_intent=ToolIntent.STORY_TELLING, language=Language.HINGLISH, description="Rainy day story"),
-            AccuracyTestCase(input_text="Grandma used to tell such beautiful stories, I want something similar", expected_tool="nani_kahaniyan", expected_intent=ToolIntent.STORY_TELLING, language=Language.ENGLISH, description="Grandma style stories"),
-
-            # Poem scenarios - emotions, occasions, moods
-            AccuracyTestCase(input_text="I'm feeling melancholic today, need some poetry to match my mood", expected_tool="poem_generator", expected_intent=ToolIntent.POEM_GENERATION, language=Language.ENGLISH, description="Melancholic mood poetry"),
-            AccuracyTestCase(input_text="Anniversary hai kal, wife ke liye romantic poem chahiye", expected_tool="poem_generator", expected_intent=ToolIntent.POEM_GENERATION, language=Language.HINGLISH, description="Anniversary romantic poem"),
-            AccuracyTestCase(input_text="दिल टूटा है, कुछ दर्द भरी शायरी सुनाओ", expected_tool="poem_generator", expected_intent=ToolIntent.POEM_GENERATION, language=Language.HINDI, description="Heartbreak shayari"),
-            AccuracyTestCase(input_text="Spring season ke liye nature poetry create karo", expected_tool="poem_generator", expected_intent=ToolIntent.POEM_GENERATION, language=Language.HINGLISH, description="Spring nature poetry"),
-            AccuracyTestCase(input_text="Friend को motivate करने के लिए inspirational poem", expected_tool="poem_generator", expected_intent=ToolIntent.POEM_GENERATION, language=Language.HINGLISH, description="Motivational poem for friend"),
-
-            # Music scenarios - moods, occasions, nostalgia
-            AccuracyTestCase(input_text="Feeling nostalgic about childhood, want some old melodies", expected_tool="vividh_bharti", expected_intent=ToolIntent.MUSIC_RECOMMENDATION, language=Language.ENGLISH, description="Childhood nostalgia"),
-            AccuracyTestCase(input_text="Papa के साथ बैठकर पुराने गाने सुनना है", expected_tool="vividh_bharti", expected_intent=ToolIntent.MUSIC_RECOMMENDATION, language=Language.HINDI, description="Listen with father"),
-            AccuracyTestCase(input_text="Long drive pe jaana hai, classic songs recommend karo", expected_tool="vividh_bharti", expected_intent=ToolIntent.MUSIC_RECOMMENDATION, language=Language.HINGLISH, description="Long drive classics"),
-            AccuracyTestCase(input_text="Raining outside, old romantic songs ka mood hai", expected_tool="vividh_bharti", expected_intent=ToolIntent.MUSIC_RECOMMENDATION, language=Language.HINGLISH, description="Rainy romantic mood"),
-            AccuracyTestCase(input_text="Study करते समय background में soft classical music चाहिए", expected_tool="vividh_bharti", expected_intent=ToolIntent.MUSIC_RECOMMENDATION, language=Language.HINGLISH, description="Study background music"),
-
-            # Food location scenarios - practical needs
-            AccuracyTestCase(input_text="New in this city, where do locals eat good food?", expected_tool="food_locator", expected_intent=ToolIntent.FOOD_LOCATION, language=Language.ENGLISH, description="New in city locals eat"),
-            AccuracyTestCase(input_text="Date night plan kar raha hun, romantic restaurant suggest karo", expected_tool="food_locator", expected_intent=ToolIntent.FOOD_LOCATION, language=Language.HINGLISH, description="Date night planning"),
-            AccuracyTestCase(input_text="ऑफिस से निकलकर तुरंत कहीं खाना खाना है", expected_tool="food_locator", expected_intent=ToolIntent.FOOD_LOCATION, language=Language.HINDI, description="Quick food after office"),
-            AccuracyTestCase(input_text="Family celebration hai, sab ko pasand aane wala place batao", expected_tool="food_locator", expected_intent=ToolIntent.FOOD_LOCATION, language=Language.HINGLISH, description="Family celebration restaurant"),
-            AccuracyTestCase(input_text="Late night hunger strike, kya open rahta hai yahan?", expected_tool="food_locator", expected_intent=ToolIntent.FOOD_LOCATION, language=Language.HINGLISH, description="Late night food options")
-        ]
+    def generate_training_data(self, *, include_description: bool = False) -> List[Dict]:
+        """Generate comprehensive training dataset
+        
+        Descriptions are only useful for error analysis, so they are left out
+        unless include_description is set.
+        """
+        keys = _record_keys(include_description)
+        # zip stops at the shorter keys tuple, dropping the trailing description
+        return [dict(zip(keys, row)) for row in _unique_rows()]
     
-    def _get_edge_cases(self) -> List[AccuracyTestCase]:
-        """Edge cases and variations"""
-        return [
-            # Ambiguous/challenging recipe requests
-            AccuracyTestCase(input_text="Can you help me avoid food waste?", expected_tool="leftover_chef", expected_intent=ToolIntent.RECIPE_SUGGESTION, language=Language.ENGLISH, description="Food waste prevention"),
-            AccuracyTestCase(input_text="I hate throwing away food", expected_tool="leftover_chef", expected_intent=ToolIntent.RECIPE_SUGGESTION, language=Language.ENGLISH, description="Hate food waste"),
-            AccuracyTestCase(input_text="My fridge is almost empty but I need to cook", expected_tool="leftover_chef", expected_intent=ToolIntent.RECIPE_SUGGESTION, language=Language.ENGLISH, description="Empty fridge cooking"),
-            AccuracyTestCase(input_text="Kuch banao jo ghar mein available ingredients se ho", expected_tool="leftover_chef", expected_intent=ToolIntent.RECIPE_SUGGESTION, language=Language.HINGLISH, description="Available ingredients cooking"),
-            AccuracyTestCase(input_text="घर में कुछ नहीं है फिर भी खाना बनाना है", expected_tool="leftover_chef", expected_intent=ToolIntent.RECIPE_SUGGESTION, language=Language.HINDI, description="Nothing at home cooking"),
-
-            # Tricky story requests
-            AccuracyTestCase(input_text="I need something to calm down anxious kids", expected_tool="nani_kahaniyan", expected_intent=ToolIntent.STORY_TELLING, language=Language.ENGLISH, description="Calm anxious kids"),
-            AccuracyTestCase(input_text="Moral teachings through entertainment", expected_tool="nani_kahaniyan", expected_intent=ToolIntent.STORY_TELLING, language=Language.ENGLISH, description="Moral through entertainment"),
-            AccuracyTestCase(input_text="Something like grandma's bedtime stories", expected_tool="nani_kahaniyan", expected_intent=ToolIntent.STORY_TELLING, language=Language.ENGLISH, description="Grandma bedtime stories"),
-            AccuracyTestCase(input_text="बच्चों को कुछ सिखाना है मगर बोरिंग नहीं होना चाहिए", expected_tool="nani_kahaniyan", expected_intent=ToolIntent.STORY_TELLING, language=Language.HINDI, description="Teach kids not boring"),
-            AccuracyTestCase(input_text="Entertainment ke साथ कुछ values भी देना चाहता हूं", expected_tool="nani_kahaniyan", expected_intent=ToolIntent.STORY_TELLING, language=Language.HINGLISH, description="Entertainment with values"),
-
-            # Complex poetry requests
-            AccuracyTestCase(input_text="I need words to express my feelings", expected_tool="poem_generator", expected_intent=ToolIntent.POEM_GENERATION, language=Language.ENGLISH, description="Express feelings through words"),
-            AccuracyTestCase(input_text="Something artistic and beautiful with words", expected_tool="poem_generator", expected_intent=ToolIntent.POEM_GENERATION, language=Language.ENGLISH, description="Artistic beautiful words"),
-            AccuracyTestCase(input_text="Create some beautiful verses for me", expected_tool="poem_generator", expected_intent=ToolIntent.POEM_GENERATION, language=Language.ENGLISH, description="Beautiful verses creation"),
-            AccuracyTestCase(input_text="मन की बात कहने का कलात्मक तरीका चाहिए", expected_tool="poem_generator", expected_intent=ToolIntent.POEM_GENERATION, language=Language.HINDI, description="Artistic way to express heart"),
-            AccuracyTestCase(input_text="Words में beauty express करना चाहता हूं", expected_tool="poem_generator", expected_intent=ToolIntent.POEM_GENERATION, language=Language.HINGLISH, description="Beauty expression in words"),
-
-            # Unusual music requests
-            AccuracyTestCase(input_text="I want music that takes me back in time", expected_tool="vividh_bharti", expected_intent=ToolIntent.MUSIC_RECOMMENDATION, language=Language.ENGLISH, description="Time travel music"),
-            AccuracyTestCase(input_text="Something that my parents' generation would love", expected_tool="vividh_bharti", expected_intent=ToolIntent.MUSIC_RECOMMENDATION, language=Language.ENGLISH, description="Parents generation music"),
-            AccuracyTestCase(input_text="Music from the golden era of cinema", expected_tool="vividh_bharti", expected_intent=ToolIntent.MUSIC_RECOMMENDATION, language=Language.ENGLISH, description="Golden era cinema music"),
-            AccuracyTestCase(input_text="वो गाने जो दादी-नानी के जमाने के हैं", expected_tool="vividh_bharti", expected_intent=ToolIntent.MUSIC_RECOMMENDATION, language=Language.HINDI, description="Grandparents era songs"),
-            AccuracyTestCase(input_text="Purane memories wale songs chahiye", expected_tool="vividh_bharti", expected_intent=ToolIntent.MUSIC_RECOMMENDATION, language=Language.HINGLISH, description="Old memories songs"),
-
-            # Indirect location requests
-            AccuracyTestCase(input_text="I'm hungry and need to find a place to eat", expected_tool="food_locator", expected_intent=ToolIntent.FOOD_LOCATION, language=Language.ENGLISH, description="Hungry need place to eat"),
-            AccuracyTestCase(input_text="Where can I grab a quick bite around here?", expected_tool="food_locator", expected_intent=ToolIntent.FOOD_LOCATION, language=Language.ENGLISH, description="Quick bite around here"),
-            AccuracyTestCase(input_text="I need dining recommendations for this area", expected_tool="food_locator", expected_intent=ToolIntent.FOOD_LOCATION, language=Language.ENGLISH, description="Dining recommendations area"),
-            AccuracyTestCase(input_text="भोजन के लिए कोई अच्छी जगह सुझाएं", expected_tool="food_locator", expected_intent=ToolIntent.FOOD_LOCATION, language=Language.HINDI, description="Good place for food"),
-            AccuracyTestCase(input_text="Koi achha खाने का स्थान बताइए यहाँ", expected_tool="food_locator", expected_intent=ToolIntent.FOOD_LOCATION, language=Language.HINGLISH, description="Good eating place here"),
-
-            # Challenging mixed language cases
-            AccuracyTestCase(input_text="Yesterday ki leftover sabzi से today kya special बना सकते हैं?", expected_tool="leftover_chef", expected_intent=ToolIntent.RECIPE_SUGGESTION, language=Language.HINGLISH, description="Yesterday leftover today special"),
-            AccuracyTestCase(input_text="Kids को entertaining रखने के लिए some अच्छी story suggest करो", expected_tool="nani_kahaniyan", expected_intent=ToolIntent.STORY_TELLING, language=Language.HINGLISH, description="Kids entertaining good story"),
-            AccuracyTestCase(input_text="Heart की feelings को express करने के लिए beautiful poetry चाहिए", expected_tool="poem_generator", expected_intent=ToolIntent.POEM_GENERATION, language=Language.HINGLISH, description="Heart feelings express poetry"),
-            AccuracyTestCase(input_text="Mood को अच्छा करने के लिए some classic गाने recommend करो", expected_tool="vividh_bharti", expected_intent=ToolIntent.MUSIC_RECOMMENDATION, language=Language.HINGLISH, description="Mood good classic songs"),
-            AccuracyTestCase(input_text="यहाँ के area में कोई good eating spots हैं क्या?", expected_tool="food_locator", expected_intent=ToolIntent.FOOD_LOCATION, language=Language.HINGLISH, description="Area good eating spots")
-        ]
+    def generate_training_columns(self, *, include_description: bool = False) -> Dict[str, List[str]]:
+        """Generate the training dataset as columns keyed like RECORD_KEYS
+        
+        Suitable for datasets.Dataset.from_dict or pandas.DataFrame without
+        transposing a list of records first.
+        """
+        keys = _record_keys(include_description)
+        rows = _unique_rows()
+        if not rows:
+            return {key: [] for key in keys}
+        return {key: list(column) for key, column in zip(keys, zip(*rows))}
     
-    def _get_conversation_patterns(self) -> List[AccuracyTestCase]:
-        """Natural conversation patterns"""
-        return [
-            # Casual conversation starters
-            AccuracyTestCase(input_text="Yaar, I'm so confused what to cook today", expected_tool="leftover_chef", expected_intent=ToolIntent.RECIPE_SUGGESTION, language=Language.HINGLISH, description="Casual cooking confusion"),
-            AccuracyTestCase(input_text="Dude, can you help me figure out dinner?", expected_tool="leftover_chef", expected_intent=ToolIntent.RECIPE_SUGGESTION, language=Language.ENGLISH, description="Casual dinner help"),
-            AccuracyTestCase(input_text="यार कुछ समझ नहीं आ रहा खाने में", expected_tool="leftover_chef", expected_intent=ToolIntent.RECIPE_SUGGESTION, language=Language.HINDI, description="Nothing understand in food"),
-            AccuracyTestCase(input_text="Bro, ghar pe kuch ingredients pada hai, help kar do", expected_tool="leftover_chef", expected_intent=ToolIntent.RECIPE_SUGGESTION, language=Language.HINGLISH, description="Bro ingredients help"),
-
-            # Question-style conversations
-            AccuracyTestCase(input_text="Hey, you know any good bedtime stories?", expected_tool="nani_kahaniyan", expected_intent=ToolIntent.STORY_TELLING, language=Language.ENGLISH, description="Hey bedtime stories"),
-            AccuracyTestCase(input_text="क्या तुम्हें कोई अच्छी कहानी आती है?", expected_tool="nani_kahaniyan", expected_intent=ToolIntent.STORY_TELLING, language=Language.HINDI, description="Do you know good story"),
-            AccuracyTestCase(input_text="Kya yaar, koi interesting story pata hai?", expected_tool="nani_kahaniyan", expected_intent=ToolIntent.STORY_TELLING, language=Language.HINGLISH, description="What yaar interesting story"),
-            AccuracyTestCase(input_text="Can you tell me something entertaining for kids?", expected_tool="nani_kahaniyan", expected_intent=ToolIntent.STORY_TELLING, language=Language.ENGLISH, description="Something entertaining kids"),
-
-            # Emotional/mood-based requests
-            AccuracyTestCase(input_text="I'm feeling really emotional right now, need something poetic", expected_tool="poem_generator", expected_intent=ToolIntent.POEM_GENERATION, language=Language.ENGLISH, description="Emotional need poetic"),
-            AccuracyTestCase(input_text="आज बहुत उदास हूं, कुछ दिल को छूने वाली चीज़ चाहिए", expected_tool="poem_generator", expected_intent=ToolIntent.POEM_GENERATION, language=Language.HINDI, description="Very sad heart touching thing"),
-            AccuracyTestCase(input_text="Yaar mood thoda off hai, koi achhi poetry sunao na", expected_tool="poem_generator", expected_intent=ToolIntent.POEM_GENERATION, language=Language.HINGLISH, description="Mood off good poetry"),
-            AccuracyTestCase(input_text="I just want some beautiful words right now", expected_tool="poem_generator", expected_intent=ToolIntent.POEM_GENERATION, language=Language.ENGLISH, description="Beautiful words right now"),
-
-            # Music mood requests
-            AccuracyTestCase(input_text="Man, I'm feeling so nostalgic today", expected_tool="vividh_bharti", expected_intent=ToolIntent.MUSIC_RECOMMENDATION, language=Language.ENGLISH, description="Feeling nostalgic today"),
-            AccuracyTestCase(input_text="आज पुराने दिन याद आ रहे हैं", expected_tool="vividh_bharti", expected_intent=ToolIntent.MUSIC_RECOMMENDATION, language=Language.HINDI, description="Old days remembering today"),
-            AccuracyTestCase(input_text="Yaar, bachpan ki yaadein aa rahi hain", expected_tool="vividh_bharti", expected_intent=ToolIntent.MUSIC_RECOMMENDATION, language=Language.HINGLISH, description="Childhood memories coming"),
-            AccuracyTestCase(input_text="Can you play something that reminds me of good old days?", expected_tool="vividh_bharti", expected_intent=ToolIntent.MUSIC_RECOMMENDATION, language=Language.ENGLISH, description="Good old days reminder"),
-
-            # Casual location requests  
-            AccuracyTestCase(input_text="Bro, I'm starving, where should I go?", expected_tool="food_locator", expected_intent=ToolIntent.FOOD_LOCATION, language=Language.ENGLISH, description="Starving where go"),
-            AccuracyTestCase(input_text="यार भूख बहुत लग रही है, कहाँ जाऊं?", expected_tool="food_locator", expected_intent=ToolIntent.FOOD_LOCATION, language=Language.HINDI, description="Very hungry where go"),
-            AccuracyTestCase(input_text="Dude, yahan pe koi achhi jagah hai khane ke liye?", expected_tool="food_locator", expected_intent=ToolIntent.FOOD_LOCATION, language=Language.HINGLISH, description="Good place here eating"),
-            AccuracyTestCase(input_text="I don't know this area, where do people usually eat?", expected_tool="food_locator", expected_intent=ToolIntent.FOOD_LOCATION, language=Language.ENGLISH, description="Don't know area people eat"),
-
-            # Friendly conversational tone
-            AccuracyTestCase(input_text="Hey buddy, what should I do with all this leftover stuff?", expected_tool="leftover_chef", expected_intent=ToolIntent.RECIPE_SUGGESTION, language=Language.ENGLISH, description="Buddy leftover stuff"),
-            AccuracyTestCase(input_text="यार मेरे पास ये सब चीज़ें हैं, कुछ बता दो", expected_tool="leftover_chef", expected_intent=ToolIntent.RECIPE_SUGGESTION, language=Language.HINDI, description="Yaar these things tell something"),
-            AccuracyTestCase(input_text="Arre yaar, help kar do cooking mein", expected_tool="leftover_chef", expected_intent=ToolIntent.RECIPE_SUGGESTION, language=Language.HINGLISH, description="Arre yaar help cooking"),
-
-            # Polite conversational requests
-            AccuracyTestCase(input_text="Would you mind sharing a nice story with me?", expected_tool="nani_kahaniyan", expected_intent=ToolIntent.STORY_TELLING, language=Language.ENGLISH, description="Mind sharing nice story"),
-            AccuracyTestCase(input_text="अगर आप कोई अच्छी कहानी बता सकें तो...", expected_tool="nani_kahaniyan", expected_intent=ToolIntent.STORY_TELLING, language=Language.HINDI, description="If you can tell good story"),
-            AccuracyTestCase(input_text="Please yaar, koi sundar si kavita suna do", expected_tool="poem_generator", expected_intent=ToolIntent.POEM_GENERATION, language=Language.HINGLISH, description="Please beautiful poem"),
-
-            # Excited/enthusiastic tone
-            AccuracyTestCase(input_text="Oh wow, I'd love to hear some classic music!", expected_tool="vividh_bharti", expected_intent=ToolIntent.MUSIC_RECOMMENDATION, language=Language.ENGLISH, description="Love classic music"),
-            AccuracyTestCase(input_text="अरे वाह! कुछ पुराने गाने सुनाओ ना", expected_tool="vividh_bharti", expected_intent=ToolIntent.MUSIC_RECOMMENDATION, language=Language.HINDI, description="Oh wow old songs"),
-            AccuracyTestCase(input_text="Awesome! Yahan ka food scene explore karna hai", expected_tool="food_locator", expected_intent=ToolIntent.FOOD_LOCATION, language=Language.HINGLISH, description="Awesome food scene explore"),
-
-            # Seeking suggestions/advice
-            AccuracyTestCase(input_text="Any suggestions for what I should cook tonight?", expected_tool="leftover_chef", expected_intent=ToolIntent.RECIPE_SUGGESTION, language=Language.ENGLISH, description="Suggestions cook tonight"),
-            AccuracyTestCase(input_text="कुछ सुझाव दे दो आज रात के खाने के लिए", expected_tool="leftover_chef", expected_intent=ToolIntent.RECIPE_SUGGESTION, language=Language.HINDI, description="Some suggestions tonight food"),
-            AccuracyTestCase(input_text="Koi achha suggestion do na yaar", expected_tool="leftover_chef", expected_intent=ToolIntent.RECIPE_SUGGESTION, language=Language.HINGLISH, description="Good suggestion do yaar"),
-            AccuracyTestCase(input_text="What would you recommend for someone new to this city?", expected_tool="food_locator", expected_intent=ToolIntent.FOOD_LOCATION, language=Language.ENGLISH, description="Recommend new city"),
-
-            # Informal slang and expressions
-            AccuracyTestCase(input_text="Yaar ab kya karu, sab ingredients khatam ho gaye", expected_tool="leftover_chef", expected_intent=ToolIntent.RECIPE_SUGGESTION, language=Language.HINGLISH, description="What do all ingredients finished"),
-            AccuracyTestCase(input_text="Dude I'm totally clueless about food places here", expected_tool="food_locator", expected_intent=ToolIntent.FOOD_LOCATION, language=Language.ENGLISH, description="Totally clueless food places"),
-            AccuracyTestCase(input_text="Boss, koi dhinchak poetry suna do", expected_tool="poem_generator", expected_intent=ToolIntent.POEM_GENERATION, language=Language.HINGLISH, description="Boss awesome poetry")
-        ]
+    def iter_test_cases(self) -> Iterator[AccuracyTestCase]:
+        """Yield the deduplicated corpus as AccuracyTestCase models, built on demand"""
+        for text, intent, tool, language, description in _unique_rows():
+            # Corpus rows list the intent before the tool
+            yield AccuracyTestCase.from_row((text, tool, intent, language, description))
     
-    def _get_formal_variations(self) -> List[AccuracyTestCase]:
-        """Professional and formal variations + targeted improvements for misclassification issues"""
-        return [
-            # Formal/polite recipe requests
-            AccuracyTestCase(input_text="I would appreciate some guidance on utilizing leftover ingredients", expected_tool="leftover_chef", expected_intent=ToolIntent.RECIPE_SUGGESTION, language=Language.ENGLISH, description="Formal guidance leftover ingredients"),
-            AccuracyTestCase(input_text="Could you please suggest efficient ways to use remaining food items?", expected_tool="leftover_chef", expected_intent=ToolIntent.RECIPE_SUGGESTION, language=Language.ENGLISH, description="Polite efficient ways remaining food"),
-            AccuracyTestCase(input_text="I would like assistance with meal preparation using available ingredients", expected_tool="leftover_chef", expected_intent=ToolIntent.RECIPE_SUGGESTION, language=Language.ENGLISH, description="Formal meal preparation assistance"),
-            AccuracyTestCase(input_text="बचे हुए भोजन सामग्री का उपयोग करने की कृपया सलाह दें", expected_tool="leftover_chef", expected_intent=ToolIntent.RECIPE_SUGGESTION, language=Language.HINDI, description="Formal advice leftover food materials"),
-            AccuracyTestCase(input_text="May I request suggestions for utilizing leftover ingredients efficiently?", expected_tool="leftover_chef", expected_intent=ToolIntent.RECIPE_SUGGESTION, language=Language.ENGLISH, description="May request suggestions efficiently"),
-
-            # Professional story requests
-            AccuracyTestCase(input_text="I would appreciate a narrative suitable for children's education", expected_tool="nani_kahaniyan", expected_intent=ToolIntent.STORY_TELLING, language=Language.ENGLISH, description="Narrative children education"),
-            AccuracyTestCase(input_text="Could you provide an educational story with moral values?", expected_tool="nani_kahaniyan", expected_intent=ToolIntent.STORY_TELLING, language=Language.ENGLISH, description="Educational story moral values"),
-            AccuracyTestCase(input_text="बच्चों के चरित्र निर्माण हेतु कोई उपयुक्त कहानी सुझाएं", expected_tool="nani_kahaniyan", expected_intent=ToolIntent.STORY_TELLING, language=Language.HINDI, description="Children character building story"),
-            AccuracyTestCase(input_text="I require a suitable narrative for bedtime storytelling", expected_tool="nani_kahaniyan", expected_intent=ToolIntent.STORY_TELLING, language=Language.ENGLISH, description="Suitable narrative bedtime storytelling"),
-            AccuracyTestCase(input_text="Please provide a story that would be appropriate for young audiences", expected_tool="nani_kahaniyan", expected_intent=ToolIntent.STORY_TELLING, language=Language.ENGLISH, description="Story appropriate young audiences"),
-
-            # Formal poetry requests
-            AccuracyTestCase(input_text="I would be grateful for some literary composition", expected_tool="poem_generator", expected_intent=ToolIntent.POEM_GENERATION, language=Language.ENGLISH, description="Grateful literary composition"),
-            AccuracyTestCase(input_text="Could you create some verse for artistic purposes?", expected_tool="poem_generator", expected_intent=ToolIntent.POEM_GENERATION, language=Language.ENGLISH, description="Create verse artistic purposes"),
-            AccuracyTestCase(input_text="कृपया कुछ काव्यात्मक रचना प्रस्तुत करें", expected_tool="poem_generator", expected_intent=ToolIntent.POEM_GENERATION, language=Language.HINDI, description="Please present poetic creation"),
-            AccuracyTestCase(input_text="I seek assistance in creating poetic expression", expected_tool="poem_generator", expected_intent=ToolIntent.POEM_GENERATION, language=Language.ENGLISH, description="Seek assistance poetic expression"),
-            AccuracyTestCase(input_text="May I request some elegant verses for appreciation?", expected_tool="poem_generator", expected_intent=ToolIntent.POEM_GENERATION, language=Language.ENGLISH, description="Request elegant verses appreciation"),
-
-            # Professional music requests
-            AccuracyTestCase(input_text="I would appreciate recommendations for classical music selections", expected_tool="vividh_bharti", expected_intent=ToolIntent.MUSIC_RECOMMENDATION, language=Language.ENGLISH, description="Appreciate classical music selections"),
-            AccuracyTestCase(input_text="Could you suggest some traditional melodic compositions?", expected_tool="vividh_bharti", expected_intent=ToolIntent.MUSIC_RECOMMENDATION, language=Language.ENGLISH, description="Suggest traditional melodic compositions"),
-            AccuracyTestCase(input_text="कृपया पारंपरिक संगीत की अनुशंसा करें", expected_tool="vividh_bharti", expected_intent=ToolIntent.MUSIC_RECOMMENDATION, language=Language.HINDI, description="Please recommend traditional music"),
-            AccuracyTestCase(input_text="I am interested in vintage musical recommendations", expected_tool="vividh_bharti", expected_intent=ToolIntent.MUSIC_RECOMMENDATION, language=Language.ENGLISH, description="Interested vintage musical recommendations"),
-            AccuracyTestCase(input_text="Please provide suggestions for nostalgic musical content", expected_tool="vividh_bharti", expected_intent=ToolIntent.MUSIC_RECOMMENDATION, language=Language.ENGLISH, description="Suggestions nostalgic musical content"),
-
-            # Formal dining requests
-            AccuracyTestCase(input_text="I would appreciate dining establishment recommendations", expected_tool="food_locator", expected_intent=ToolIntent.FOOD_LOCATION, language=Language.ENGLISH, description="Appreciate dining establishment recommendations"),
-            AccuracyTestCase(input_text="Could you suggest reputable restaurants in this vicinity?", expected_tool="food_locator", expected_intent=ToolIntent.FOOD_LOCATION, language=Language.ENGLISH, description="Suggest reputable restaurants vicinity"),
-            AccuracyTestCase(input_text="भोजन के लिए उचित स्थानों की जानकारी प्रदान करें", expected_tool="food_locator", expected_intent=ToolIntent.FOOD_LOCATION, language=Language.HINDI, description="Provide information suitable places food"),
-            AccuracyTestCase(input_text="I require assistance in locating quality dining options", expected_tool="food_locator", expected_intent=ToolIntent.FOOD_LOCATION, language=Language.ENGLISH, description="Require assistance quality dining options"),
-            AccuracyTestCase(input_text="May I request information about local culinary establishments?", expected_tool="food_locator", expected_intent=ToolIntent.FOOD_LOCATION, language=Language.ENGLISH, description="Request information local culinary establishments"),
-
-            # Business/professional context
-            AccuracyTestCase(input_text="I need culinary solutions for office meal preparation", expected_tool="leftover_chef", expected_intent=ToolIntent.RECIPE_SUGGESTION, language=Language.ENGLISH, description="Culinary solutions office meal preparation"),
-            AccuracyTestCase(input_text="व्यावसायिक उद्देश्य से भोजन तैयारी में सहायता चाहिए", expected_tool="leftover_chef", expected_intent=ToolIntent.RECIPE_SUGGESTION, language=Language.HINDI, description="Professional purpose food preparation help"),
-            AccuracyTestCase(input_text="I require content suitable for educational storytelling", expected_tool="nani_kahaniyan", expected_intent=ToolIntent.STORY_TELLING, language=Language.ENGLISH, description="Content suitable educational storytelling"),
-            AccuracyTestCase(input_text="Please provide literary content for presentation purposes", expected_tool="poem_generator", expected_intent=ToolIntent.POEM_GENERATION, language=Language.ENGLISH, description="Literary content presentation purposes"),
-
-            # TARGETED IMPROVEMENTS: Music vs Recipe Distinction
-            AccuracyTestCase(input_text="Purane gaane sunao yaar", expected_tool="vividh_bharti", expected_intent=ToolIntent.MUSIC_RECOMMENDATION, language=Language.HINGLISH, description="Clear old songs request"),
-            AccuracyTestCase(input_text="90s ke hit songs baja do", expected_tool="vividh_bharti", expected_intent=ToolIntent.MUSIC_RECOMMENDATION, language=Language.HINGLISH, description="90s music request"),
-            AccuracyTestCase(input_text="Gaane recommend karo purane", expected_tool="vividh_bharti", expected_intent=ToolIntent.MUSIC_RECOMMENDATION, language=Language.HINGLISH, description="Recommend old songs"),
-            AccuracyTestCase(input_text="Music baja do nostalgic", expected_tool="vividh_bharti", expected_intent=ToolIntent.MUSIC_RECOMMENDATION, language=Language.HINGLISH, description="Play nostalgic music"),
-            AccuracyTestCase(input_text="गाने सुनना है classic", expected_tool="vividh_bharti", expected_intent=ToolIntent.MUSIC_RECOMMENDATION, language=Language.HINGLISH, description="Want to listen classic songs"),
-            AccuracyTestCase(input_text="Songs play karo 80s ke", expected_tool="vividh_bharti", expected_intent=ToolIntent.MUSIC_RECOMMENDATION, language=Language.HINGLISH, description="Play 80s songs"),
-            AccuracyTestCase(input_text="Melodious gaane recommend करो", expected_tool="vividh_bharti", expected_intent=ToolIntent.MUSIC_RECOMMENDATION, language=Language.HINGLISH, description="Recommend melodic songs"),
-            AccuracyTestCase(input_text="Classical music sunao hindi", expected_tool="vividh_bharti", expected_intent=ToolIntent.MUSIC_RECOMMENDATION, language=Language.HINGLISH, description="Hindi classical music"),
-
-            # Clear Recipe Examples (to contrast with music)
-            AccuracyTestCase(input_text="Khana banana hai leftover se", expected_tool="leftover_chef", expected_intent=ToolIntent.RECIPE_SUGGESTION, language=Language.HINGLISH, description="Cook food from leftovers"),
-            AccuracyTestCase(input_text="Recipe बताओ बचे खाने की", expected_tool="leftover_chef", expected_intent=ToolIntent.RECIPE_SUGGESTION, language=Language.HINGLISH, description="Recipe for leftover food"),
-            AccuracyTestCase(input_text="Cooking tips chahiye urgent", expected_tool="leftover_chef", expected_intent=ToolIntent.RECIPE_SUGGESTION, language=Language.HINGLISH, description="Urgent cooking tips"),
-            AccuracyTestCase(input_text="Sabzi banana hai leftover rice se", expected_tool="leftover_chef", expected_intent=ToolIntent.RECIPE_SUGGESTION, language=Language.HINGLISH, description="Make vegetable from leftover rice"),
-            AccuracyTestCase(input_text="Meal prep करना है बचे खाने से", expected_tool="leftover_chef", expected_intent=ToolIntent.RECIPE_SUGGESTION, language=Language.HINGLISH, description="Meal prep from leftovers"),
-
-            # Courteous formal requests
-            AccuracyTestCase(input_text="If it's not too much trouble, could you help with meal planning?", expected_tool="leftover_chef", expected_intent=ToolIntent.RECIPE_SUGGESTION, language=Language.ENGLISH, description="Not trouble help meal planning"),
-            AccuracyTestCase(input_text="I would be most grateful for your assistance with dining recommendations", expected_tool="food_locator", expected_intent=ToolIntent.FOOD_LOCATION, language=Language.ENGLISH, description="Most grateful assistance dining recommendations"),
-            AccuracyTestCase(input_text="यदि संभव हो तो कृपया उपयुक्त संगीत सुझाव दें", expected_tool="vividh_bharti", expected_intent=ToolIntent.MUSIC_RECOMMENDATION, language=Language.HINDI, description="If possible please suitable music suggestions"),
-            AccuracyTestCase(input_text="I would be honored if you could share some poetry", expected_tool="poem_generator", expected_intent=ToolIntent.POEM_GENERATION, language=Language.ENGLISH, description="Honored share some poetry"),
-
-            # Additional Music Clarity Examples
-            AccuracyTestCase(input_text="Audio sunna hai old songs", expected_tool="vividh_bharti", expected_intent=ToolIntent.MUSIC_RECOMMENDATION, language=Language.HINGLISH, description="Want to listen old songs audio"),
-            AccuracyTestCase(input_text="Melodic tunes recommend karo", expected_tool="vividh_bharti", expected_intent=ToolIntent.MUSIC_RECOMMENDATION, language=Language.HINGLISH, description="Recommend melodic tunes"),
-            AccuracyTestCase(input_text="Vintage music collection batao", expected_tool="vividh_bharti", expected_intent=ToolIntent.MUSIC_RECOMMENDATION, language=Language.HINGLISH, description="Tell vintage music collection"),
-            AccuracyTestCase(input_text="Golden era के गाने suggest करो", expected_tool="vividh_bharti", expected_intent=ToolIntent.MUSIC_RECOMMENDATION, language=Language.HINGLISH, description="Suggest golden era songs"),
-            
-            # Edge cases to prevent music-recipe confusion
-            AccuracyTestCase(input_text="Songs nahi banana, sunana hai", expected_tool="vividh_bharti", expected_intent=ToolIntent.MUSIC_RECOMMENDATION, language=Language.HINGLISH, description="Not making songs, want to listen"),
-            AccuracyTestCase(input_text="Music play करो, cooking नहीं", expected_tool="vividh_bharti", expected_intent=ToolIntent.MUSIC_RECOMMENDATION, language=Language.HINGLISH, description="Play music not cooking"),
-            AccuracyTestCase(input_text="गाने listen करना है, बनाना नहीं", expected_tool="vividh_bharti", expected_intent=ToolIntent.MUSIC_RECOMMENDATION, language=Language.HINGLISH, description="Want to listen songs not make")
-        ]
-    
-    def _get_enhanced_training_examples(self) -> List[AccuracyTestCase]:
-        """Enhanced training examples to reach ~500 total - focusing on failure areas"""
-        return [
-            # MASSIVE MUSIC EXAMPLES (60 examples) - Fix "Purane gaane" issue
-            AccuracyTestCase(input_text="Purane gaane baja do please", expected_tool="vividh_bharti", expected_intent=ToolIntent.MUSIC_RECOMMENDATION, language=Language.HINGLISH, description="Please play old songs"),
-            AccuracyTestCase(input_text="Classic songs sunao yaar", expected_tool="vividh_bharti", expected_intent=ToolIntent.MUSIC_RECOMMENDATION, language=Language.HINGLISH, description="Listen classic songs friend"),
-            AccuracyTestCase(input_text="Old melodies recommend karo", expected_tool="vividh_bharti", expected_intent=ToolIntent.MUSIC_RECOMMENDATION, language=Language.HINGLISH, description="Recommend old melodies"),
-            AccuracyTestCase(input_text="Vintage music collection dikhao", expected_tool="vividh_bharti", expected_intent=ToolIntent.MUSIC_RECOMMENDATION, language=Language.HINGLISH, description="Show vintage music collection"),
-            AccuracyTestCase(input_text="70s 80s ke gaane play karo", expected_tool="vividh_bharti", expected_intent=ToolIntent.MUSIC_RECOMMENDATION, language=Language.HINGLISH, description="Play 70s 80s songs"),
-            AccuracyTestCase(input_text="Nostalgic tunes chahiye", expected_tool="vividh_bharti", expected_intent=ToolIntent.MUSIC_RECOMMENDATION, language=Language.HINGLISH, description="Need nostalgic tunes"),
-            AccuracyTestCase(input_text="Golden era music recommend करो", expected_tool="vividh_bharti", expected_intent=ToolIntent.MUSIC_RECOMMENDATION, language=Language.HINGLISH, description="Recommend golden era music"),
-            AccuracyTestCase(input_text="पुराने गाने सुनने हैं", expected_tool="vividh_bharti", expected_intent=ToolIntent.MUSIC_RECOMMENDATION, language=Language.HINDI, description="Want to listen old songs"),
-            AccuracyTestCase(input_text="Melodious songs suggest karo", expected_tool="vividh_bharti", expected_intent=ToolIntent.MUSIC_RECOMMENDATION, language=Language.HINGLISH, description="Suggest melodious songs"),
-            AccuracyTestCase(input_text="Music sunna hai romantic", expected_tool="vividh_bharti", expected_intent=ToolIntent.MUSIC_RECOMMENDATION, language=Language.HINGLISH, description="Want to listen romantic music"),
-            AccuracyTestCase(input_text="Songs chahiye mood ke liye", expected_tool="vividh_bharti", expected_intent=ToolIntent.MUSIC_RECOMMENDATION, language=Language.HINGLISH, description="Need songs for mood"),
-            AccuracyTestCase(input_text="Audio music recommendations", expected_tool="vividh_bharti", expected_intent=ToolIntent.MUSIC_RECOMMENDATION, language=Language.ENGLISH, description="Audio music recommendations"),
-            AccuracyTestCase(input_text="Classical bollywood gaane", expected_tool="vividh_bharti", expected_intent=ToolIntent.MUSIC_RECOMMENDATION, language=Language.HINGLISH, description="Classical bollywood songs"),
-            AccuracyTestCase(input_text="Timeless melodies sunao", expected_tool="vividh_bharti", expected_intent=ToolIntent.MUSIC_RECOMMENDATION, language=Language.HINGLISH, description="Play timeless melodies"),
-            AccuracyTestCase(input_text="Evergreen songs collection", expected_tool="vividh_bharti", expected_intent=ToolIntent.MUSIC_RECOMMENDATION, language=Language.ENGLISH, description="Evergreen songs collection"),
-            AccuracyTestCase(input_text="संगीत सुझाव दीजिए पुराना", expected_tool="vividh_bharti", expected_intent=ToolIntent.MUSIC_RECOMMENDATION, language=Language.HINDI, description="Please suggest old music"),
-            AccuracyTestCase(input_text="Retro music baja do", expected_tool="vividh_bharti", expected_intent=ToolIntent.MUSIC_RECOMMENDATION, language=Language.HINGLISH, description="Play retro music"),
-            AccuracyTestCase(input_text="Play some vintage tunes", expected_tool="vividh_bharti", expected_intent=ToolIntent.MUSIC_RECOMMENDATION, language=Language.ENGLISH, description="Play vintage tunes"),
-            AccuracyTestCase(input_text="Old hindi film songs", expected_tool="vividh_bharti", expected_intent=ToolIntent.MUSIC_RECOMMENDATION, language=Language.ENGLISH, description="Old hindi film songs"),
-            AccuracyTestCase(input_text="Classical indian music recommend", expected_tool="vividh_bharti", expected_intent=ToolIntent.MUSIC_RECOMMENDATION, language=Language.ENGLISH, description="Classical indian music recommend"),
-
-            # RECIPE EXAMPLES (50 examples) - Clear contrast with music
-            AccuracyTestCase(input_text="Leftover rice se kya banau", expected_tool="leftover_chef", expected_intent=ToolIntent.RECIPE_SUGGESTION, language=Language.HINGLISH, description="What to make from leftover rice"),
-            AccuracyTestCase(input_text="Bache hue khane ka recipe", expected_tool="leftover_chef", expected_intent=ToolIntent.RECIPE_SUGGESTION, language=Language.HINGLISH, description="Recipe for leftover food"),
-            AccuracyTestCase(input_text="Cooking tips for leftovers", expected_tool="leftover_chef", expected_intent=ToolIntent.RECIPE_SUGGESTION, language=Language.ENGLISH, description="Cooking tips leftovers"),
-            AccuracyTestCase(input_text="Meal prep करना है बचे खाने से", expected_tool="leftover_chef", expected_intent=ToolIntent.RECIPE_SUGGESTION, language=Language.HINGLISH, description="Meal prep from leftovers"),
-            AccuracyTestCase(input_text="Recipe chahiye quick", expected_tool="leftover_chef", expected_intent=ToolIntent.RECIPE_SUGGESTION, language=Language.HINGLISH, description="Need quick recipe"),
-            AccuracyTestCase(input_text="Khana banana sikhao", expected_tool="leftover_chef", expected_intent=ToolIntent.RECIPE_SUGGESTION, language=Language.HINGLISH, description="Teach to cook food"),
-            AccuracyTestCase(input_text="Food preparation help", expected_tool="leftover_chef", expected_intent=ToolIntent.RECIPE_SUGGESTION, language=Language.ENGLISH, description="Food preparation help"),
-            AccuracyTestCase(input_text="बचे खाने से कुछ बनाना है", expected_tool="leftover_chef", expected_intent=ToolIntent.RECIPE_SUGGESTION, language=Language.HINDI, description="Want to make something from leftovers"),
-            AccuracyTestCase(input_text="Kitchen mein kya banau", expected_tool="leftover_chef", expected_intent=ToolIntent.RECIPE_SUGGESTION, language=Language.HINGLISH, description="What to make in kitchen"),
-            AccuracyTestCase(input_text="Sabzi banana hai innovative", expected_tool="leftover_chef", expected_intent=ToolIntent.RECIPE_SUGGESTION, language=Language.HINGLISH, description="Want to make innovative vegetable"),
-            AccuracyTestCase(input_text="Culinary suggestions needed", expected_tool="leftover_chef", expected_intent=ToolIntent.RECIPE_SUGGESTION, language=Language.ENGLISH, description="Culinary suggestions needed"),
-            AccuracyTestCase(input_text="Dish banane ki recipe", expected_tool="leftover_chef", expected_intent=ToolIntent.RECIPE_SUGGESTION, language=Language.HINGLISH, description="Recipe to make dish"),
-            AccuracyTestCase(input_text="Cook karne ka tarika", expected_tool="leftover_chef", expected_intent=ToolIntent.RECIPE_SUGGESTION, language=Language.HINGLISH, description="Way to cook"),
-            AccuracyTestCase(input_text="Food wastage bachane ke liye", expected_tool="leftover_chef", expected_intent=ToolIntent.RECIPE_SUGGESTION, language=Language.HINGLISH, description="To save food wastage"),
-            AccuracyTestCase(input_text="Creative cooking ideas", expected_tool="leftover_chef", expected_intent=ToolIntent.RECIPE_SUGGESTION, language=Language.ENGLISH, description="Creative cooking ideas"),
-
-            # STORY EXAMPLES (50 examples)
-            AccuracyTestCase(input_text="Bacchon ke liye kahani sunao", expected_tool="nani_kahaniyan", expected_intent=ToolIntent.STORY_TELLING, language=Language.HINGLISH, description="Tell story for children"),
-            AccuracyTestCase(input_text="Moral story batao please", expected_tool="nani_kahaniyan", expected_intent=ToolIntent.STORY_TELLING, language=Language.HINGLISH, description="Please tell moral story"),
-            AccuracyTestCase(input_text="Kids ke liye tale", expected_tool="nani_kahaniyan", expected_intent=ToolIntent.STORY_TELLING, language=Language.HINGLISH, description="Tale for kids"),
-            AccuracyTestCase(input_text="बच्चों की कहानी सुनाइए", expected_tool="nani_kahaniyan", expected_intent=ToolIntent.STORY_TELLING, language=Language.HINDI, description="Please tell children's story"),
-            AccuracyTestCase(input_text="Bedtime story chahiye", expected_tool="nani_kahaniyan", expected_intent=ToolIntent.STORY_TELLING, language=Language.HINGLISH, description="Need bedtime story"),
-            AccuracyTestCase(input_text="Educational tale batao", expected_tool="nani_kahaniyan", expected_intent=ToolIntent.STORY_TELLING, language=Language.HINGLISH, description="Tell educational tale"),
-            AccuracyTestCase(input_text="Story time for kids", expected_tool="nani_kahaniyan", expected_intent=ToolIntent.STORY_TELLING, language=Language.ENGLISH, description="Story time for kids"),
-            AccuracyTestCase(input_text="Nani ki kahaniyan sunao", expected_tool="nani_kahaniyan", expected_intent=ToolIntent.STORY_TELLING, language=Language.HINGLISH, description="Tell grandma's stories"),
-            AccuracyTestCase(input_text="Children's narrative needed", expected_tool="nani_kahaniyan", expected_intent=ToolIntent.STORY_TELLING, language=Language.ENGLISH, description="Children's narrative needed"),
-            AccuracyTestCase(input_text="Teaching story batao", expected_tool="nani_kahaniyan", expected_intent=ToolIntent.STORY_TELLING, language=Language.HINGLISH, description="Tell teaching story"),
-
-            # POEM EXAMPLES (50 examples)
-            AccuracyTestCase(input_text="Poetry sunao romantic", expected_tool="poem_generator", expected_intent=ToolIntent.POEM_GENERATION, language=Language.HINGLISH, description="Recite romantic poetry"),
-            AccuracyTestCase(input_text="Kavita likhkar dikhao", expected_tool="poem_generator", expected_intent=ToolIntent.POEM_GENERATION, language=Language.HINGLISH, description="Write and show poem"),
-            AccuracyTestCase(input_text="Love poem create karo", expected_tool="poem_generator", expected_intent=ToolIntent.POEM_GENERATION, language=Language.HINGLISH, description="Create love poem"),
-            AccuracyTestCase(input_text="कविता सुनाने का मन है", expected_tool="poem_generator", expected_intent=ToolIntent.POEM_GENERATION, language=Language.HINDI, description="Feel like listening to poetry"),
-            AccuracyTestCase(input_text="Verses generate karo", expected_tool="poem_generator", expected_intent=ToolIntent.POEM_GENERATION, language=Language.HINGLISH, description="Generate verses"),
-            AccuracyTestCase(input_text="Poetic creation chahiye", expected_tool="poem_generator", expected_intent=ToolIntent.POEM_GENERATION, language=Language.HINGLISH, description="Need poetic creation"),
-            AccuracyTestCase(input_text="Beautiful poem compose", expected_tool="poem_generator", expected_intent=ToolIntent.POEM_GENERATION, language=Language.ENGLISH, description="Compose beautiful poem"),
-            AccuracyTestCase(input_text="Shayari sunao emotional", expected_tool="poem_generator", expected_intent=ToolIntent.POEM_GENERATION, language=Language.HINGLISH, description="Recite emotional poetry"),
-            AccuracyTestCase(input_text="Literary creation needed", expected_tool="poem_generator", expected_intent=ToolIntent.POEM_GENERATION, language=Language.ENGLISH, description="Literary creation needed"),
-            AccuracyTestCase(input_text="Rhyme banao creative", expected_tool="poem_generator", expected_intent=ToolIntent.POEM_GENERATION, language=Language.HINGLISH, description="Make creative rhyme"),
-
-            # FOOD LOCATION EXAMPLES (50 examples)
-            AccuracyTestCase(input_text="Nearby restaurants batao", expected_tool="food_locator", expected_intent=ToolIntent.FOOD_LOCATION, language=Language.HINGLISH, description="Tell nearby restaurants"),
-            AccuracyTestCase(input_text="Paas mein kahan khana mile", expected_tool="food_locator", expected_intent=ToolIntent.FOOD_LOCATION, language=Language.HINGLISH, description="Where to get food nearby"),
-            AccuracyTestCase(input_text="Food places recommend karo", expected_tool="food_locator", expected_intent=ToolIntent.FOOD_LOCATION, language=Language.HINGLISH, description="Recommend food places"),
-            AccuracyTestCase(input_text="आसपास रेस्टोरेंट ढूंढो", expected_tool="food_locator", expected_intent=ToolIntent.FOOD_LOCATION, language=Language.HINDI, description="Find restaurants around"),
-            AccuracyTestCase(input_text="Dining options near me", expected_tool="food_locator", expected_intent=ToolIntent.FOOD_LOCATION, language=Language.ENGLISH, description="Dining options near me"),
-            AccuracyTestCase(input_text="Local eateries suggest", expected_tool="food_locator", expected_intent=ToolIntent.FOOD_LOCATION, language=Language.ENGLISH, description="Suggest local eateries"),
-            AccuracyTestCase(input_text="Khane ke liye jagah batao", expected_tool="food_locator", expected_intent=ToolIntent.FOOD_LOCATION, language=Language.HINGLISH, description="Tell place to eat"),
-            AccuracyTestCase(input_text="Restaurant finder chahiye", expected_tool="food_locator", expected_intent=ToolIntent.FOOD_LOCATION, language=Language.HINGLISH, description="Need restaurant finder"),
-            AccuracyTestCase(input_text="Food delivery options", expected_tool="food_locator", expected_intent=ToolIntent.FOOD_LOCATION, language=Language.ENGLISH, description="Food delivery options"),
-            AccuracyTestCase(input_text="Best cafes around here", expected_tool="food_locator", expected_intent=ToolIntent.FOOD_LOCATION, language=Language.ENGLISH, description="Best cafes around here"),
-
-            # CONFIDENCE BOOSTING EXAMPLES (20 examples) - Very clear intent
-            AccuracyTestCase(input_text="I WANT TO LISTEN TO OLD SONGS", expected_tool="vividh_bharti", expected_intent=ToolIntent.MUSIC_RECOMMENDATION, language=Language.ENGLISH, description="Clear music request caps"),
-            AccuracyTestCase(input_text="I NEED COOKING RECIPE NOW", expected_tool="leftover_chef", expected_intent=ToolIntent.RECIPE_SUGGESTION, language=Language.ENGLISH, description="Clear recipe request caps"),
-            AccuracyTestCase(input_text="TELL ME A STORY FOR CHILDREN", expected_tool="nani_kahaniyan", expected_intent=ToolIntent.STORY_TELLING, language=Language.ENGLISH, description="Clear story request caps"),
-            AccuracyTestCase(input_text="CREATE BEAUTIFUL POETRY", expected_tool="poem_generator", expected_intent=ToolIntent.POEM_GENERATION, language=Language.ENGLISH, description="Clear poetry request caps"),
-            AccuracyTestCase(input_text="FIND RESTAURANTS NEARBY", expected_tool="food_locator", expected_intent=ToolIntent.FOOD_LOCATION, language=Language.ENGLISH, description="Clear restaurant request caps"),
-            AccuracyTestCase(input_text="संगीत चलाओ तुरंत", expected_tool="vividh_bharti", expected_intent=ToolIntent.MUSIC_RECOMMENDATION, language=Language.HINDI, description="Play music immediately"),
-            AccuracyTestCase(input_text="खाना बनाना सिखाओ अभी", expected_tool="leftover_chef", expected_intent=ToolIntent.RECIPE_SUGGESTION, language=Language.HINDI, description="Teach cooking now"),
-            AccuracyTestCase(input_text="कहानी सुनाओ जल्दी", expected_tool="nani_kahaniyan", expected_intent=ToolIntent.STORY_TELLING, language=Language.HINDI, description="Tell story quickly"),
-            AccuracyTestCase(input_text="कविता लिखो फौरन", expected_tool="poem_generator", expected_intent=ToolIntent.POEM_GENERATION, language=Language.HINDI, description="Write poem immediately"),
-            AccuracyTestCase(input_text="रेस्टोरेंट खोजो आज", expected_tool="food_locator", expected_intent=ToolIntent.FOOD_LOCATION, language=Language.HINDI, description="Find restaurant today"),
-
-            # ADDITIONAL 185+ UNIQUE EXAMPLES TO REACH 500 TOTAL
-
-            # More Music Examples (50 unique)
-            AccuracyTestCase(input_text="Soulful melodies sunao please", expected_tool="vividh_bharti", expected_intent=ToolIntent.MUSIC_RECOMMENDATION, language=Language.HINGLISH, description="Soulful melodies request"),
-            AccuracyTestCase(input_text="Yesteryears ki hits batao", expected_tool="vividh_bharti", expected_intent=ToolIntent.MUSIC_RECOMMENDATION, language=Language.HINGLISH, description="Yesteryears hits"),
-            AccuracyTestCase(input_text="धुन वाले पुराने गीत", expected_tool="vividh_bharti", expected_intent=ToolIntent.MUSIC_RECOMMENDATION, language=Language.HINDI, description="Melodious old songs"),
-            AccuracyTestCase(input_text="Timeless classical tracks", expected_tool="vividh_bharti", expected_intent=ToolIntent.MUSIC_RECOMMENDATION, language=Language.ENGLISH, description="Timeless classical tracks"),
-            AccuracyTestCase(input_text="स्वर्णिम युग के संगीत", expected_tool="vividh_bharti", expected_intent=ToolIntent.MUSIC_RECOMMENDATION, language=Language.HINDI, description="Golden age music"),
-            AccuracyTestCase(input_text="Mood lifting old songs", expected_tool="vividh_bharti", expected_intent=ToolIntent.MUSIC_RECOMMENDATION, language=Language.ENGLISH, description="Mood lifting old songs"),
-            AccuracyTestCase(input_text="आत्मा को छूने वाले गाने", expected_tool="vividh_bharti", expected_intent=ToolIntent.MUSIC_RECOMMENDATION, language=Language.HINDI, description="Soul touching songs"),
-            AccuracyTestCase(input_text="Heritage music collection", expected_tool="vividh_bharti", expected_intent=ToolIntent.MUSIC_RECOMMENDATION, language=Language.ENGLISH, description="Heritage music collection"),
-            AccuracyTestCase(input_text="Traditional film songs batao", expected_tool="vividh_bharti", expected_intent=ToolIntent.MUSIC_RECOMMENDATION, language=Language.HINGLISH, description="Traditional film songs"),
-            AccuracyTestCase(input_text="Vintage bollywood melodies", expected_tool="vividh_bharti", expected_intent=ToolIntent.MUSIC_RECOMMENDATION, language=Language.ENGLISH, description="Vintage bollywood melodies"),
-
-            # More Recipe Examples (50 unique)
-            AccuracyTestCase(input_text="Transform leftovers into gourmet", expected_tool="leftover_chef", expected_intent=ToolIntent.RECIPE_SUGGESTION, language=Language.ENGLISH, description="Transform leftovers gourmet"),
-            AccuracyTestCase(input_text="बचे खाने को टेस्टी बनाओ", expected_tool="leftover_chef", expected_intent=ToolIntent.RECIPE_SUGGESTION, language=Language.HINDI, description="Make leftovers tasty"),
-            AccuracyTestCase(input_text="Innovative leftover makeover", expected_tool="leftover_chef", expected_intent=ToolIntent.RECIPE_SUGGESTION, language=Language.ENGLISH, description="Innovative leftover makeover"),
-            AccuracyTestCase(input_text="कल के खाने से नया व्यंजन", expected_tool="leftover_chef", expected_intent=ToolIntent.RECIPE_SUGGESTION, language=Language.HINDI, description="New dish from yesterday's food"),
-            AccuracyTestCase(input_text="Creative fusion with leftovers", expected_tool="leftover_chef", expected_intent=ToolIntent.RECIPE_SUGGESTION, language=Language.ENGLISH, description="Creative fusion leftovers"),
-            AccuracyTestCase(input_text="बचे सामान से मजेदार खाना", expected_tool="leftover_chef", expected_intent=ToolIntent.RECIPE_SUGGESTION, language=Language.HINDI, description="Fun food from leftover items"),
-            AccuracyTestCase(input_text="Repurpose yesterday's meal", expected_tool="leftover_chef", expected_intent=ToolIntent.RECIPE_SUGGESTION, language=Language.ENGLISH, description="Repurpose yesterday's meal"),
-            AccuracyTestCase(input_text="बासी खाने को फ्रेश बनाओ", expected_tool="leftover_chef", expected_intent=ToolIntent.RECIPE_SUGGESTION, language=Language.HINDI, description="Make stale food fresh"),
-            AccuracyTestCase(input_text="Zero waste cooking ideas", expected_tool="leftover_chef", expected_intent=ToolIntent.RECIPE_SUGGESTION, language=Language.ENGLISH, description="Zero waste cooking ideas"),
-            AccuracyTestCase(input_text="रीसायकल फूड रेसिपी", expected_tool="leftover_chef", expected_intent=ToolIntent.RECIPE_SUGGESTION, language=Language.HINDI, description="Recycle food recipe"),
-
-            # More Story Examples (35 unique)
-            AccuracyTestCase(input_text="Wisdom tales for bedtime", expected_tool="nani_kahaniyan", expected_intent=ToolIntent.STORY_TELLING, language=Language.ENGLISH, description="Wisdom tales bedtime"),
-            AccuracyTestCase(input_text="प्रेरणादायक बाल कथा", expected_tool="nani_kahaniyan", expected_intent=ToolIntent.STORY_TELLING, language=Language.HINDI, description="Inspirational children's story"),
-            AccuracyTestCase(input_text="Character building stories", expected_tool="nani_kahaniyan", expected_intent=ToolIntent.STORY_TELLING, language=Language.ENGLISH, description="Character building stories"),
-            AccuracyTestCase(input_text="मूल्यों वाली कहानी", expected_tool="nani_kahaniyan", expected_intent=ToolIntent.STORY_TELLING, language=Language.HINDI, description="Values based story"),
-            AccuracyTestCase(input_text="Life lesson narratives", expected_tool="nani_kahaniyan", expected_intent=ToolIntent.STORY_TELLING, language=Language.ENGLISH, description="Life lesson narratives"),
-            AccuracyTestCase(input_text="सीख देने वाली कथा", expected_tool="nani_kahaniyan", expected_intent=ToolIntent.STORY_TELLING, language=Language.HINDI, description="Teaching story"),
-            AccuracyTestCase(input_text="Bedtime moral fables", expected_tool="nani_kahaniyan", expected_intent=ToolIntent.STORY_TELLING, language=Language.ENGLISH, description="Bedtime moral fables"),
-            AccuracyTestCase(input_text="बुद्धिमत्ता की कहानी", expected_tool="nani_kahaniyan", expected_intent=ToolIntent.STORY_TELLING, language=Language.HINDI, description="Wisdom story"),
-            AccuracyTestCase(input_text="Traditional folk stories", expected_tool="nani_kahaniyan", expected_intent=ToolIntent.STORY_TELLING, language=Language.ENGLISH, description="Traditional folk stories"),
-            AccuracyTestCase(input_text="लोक कथा सुनाइए", expected_tool="nani_kahaniyan", expected_intent=ToolIntent.STORY_TELLING, language=Language.HINDI, description="Tell folk tale"),
-
-            # More Poem Examples (35 unique)
-            AccuracyTestCase(input_text="Heartfelt verses create karo", expected_tool="poem_generator", expected_intent=ToolIntent.POEM_GENERATION, language=Language.HINGLISH, description="Create heartfelt verses"),
-            AccuracyTestCase(input_text="भावनाओं की कविता", expected_tool="poem_generator", expected_intent=ToolIntent.POEM_GENERATION, language=Language.HINDI, description="Emotional poetry"),
-            AccuracyTestCase(input_text="Expressive poetry composition", expected_tool="poem_generator", expected_intent=ToolIntent.POEM_GENERATION, language=Language.ENGLISH, description="Expressive poetry composition"),
-            AccuracyTestCase(input_text="दिल से निकली शायरी", expected_tool="poem_generator", expected_intent=ToolIntent.POEM_GENERATION, language=Language.HINDI, description="Poetry from heart"),
-            AccuracyTestCase(input_text="Soulful rhymes and verses", expected_tool="poem_generator", expected_intent=ToolIntent.POEM_GENERATION, language=Language.ENGLISH, description="Soulful rhymes verses"),
-            AccuracyTestCase(input_text="प्रेम रस भरी कविता", expected_tool="poem_generator", expected_intent=ToolIntent.POEM_GENERATION, language=Language.HINDI, description="Love filled poetry"),
-            AccuracyTestCase(input_text="Artistic word composition", expected_tool="poem_generator", expected_intent=ToolIntent.POEM_GENERATION, language=Language.ENGLISH, description="Artistic word composition"),
-            AccuracyTestCase(input_text="छंदों में बंधी भावना", expected_tool="poem_generator", expected_intent=ToolIntent.POEM_GENERATION, language=Language.HINDI, description="Emotions bound in verses"),
-            AccuracyTestCase(input_text="Creative literary expression", expected_tool="poem_generator", expected_intent=ToolIntent.POEM_GENERATION, language=Language.ENGLISH, description="Creative literary expression"),
-            AccuracyTestCase(input_text="काव्य की मधुर धारा", expected_tool="poem_generator", expected_intent=ToolIntent.POEM_GENERATION, language=Language.HINDI, description="Sweet stream of poetry"),
-
-            # More Food Location Examples (35 unique)  
-            AccuracyTestCase(input_text="Culinary hotspots nearby", expected_tool="food_locator", expected_intent=ToolIntent.FOOD_LOCATION, language=Language.ENGLISH, description="Culinary hotspots nearby"),
-            AccuracyTestCase(input_text="स्वादिष्ट भोजन कहाँ मिले", expected_tool="food_locator", expected_intent=ToolIntent.FOOD_LOCATION, language=Language.HINDI, description="Where to get delicious food"),
-            AccuracyTestCase(input_text="Gastronomic destinations suggest", expected_tool="food_locator", expected_intent=ToolIntent.FOOD_LOCATION, language=Language.ENGLISH, description="Gastronomic destinations"),
-            AccuracyTestCase(input_text="खाने की बेहतरीन जगह", expected_tool="food_locator", expected_intent=ToolIntent.FOOD_LOCATION, language=Language.HINDI, description="Excellent food places"),
-            AccuracyTestCase(input_text="Food paradise locations", expected_tool="food_locator", expected_intent=ToolIntent.FOOD_LOCATION, language=Language.ENGLISH, description="Food paradise locations"),
-            AccuracyTestCase(input_text="मुंह में पानी लाने वाले स्थान", expected_tool="food_locator", expected_intent=ToolIntent.FOOD_LOCATION, language=Language.HINDI, description="Mouth watering places"),
-            AccuracyTestCase(input_text="Epicurean experiences nearby", expected_tool="food_locator", expected_intent=ToolIntent.FOOD_LOCATION, language=Language.ENGLISH, description="Epicurean experiences nearby"),
-            AccuracyTestCase(input_text="स्थानीय खाद्य विशेषज्ञता", expected_tool="food_locator", expected_intent=ToolIntent.FOOD_LOCATION, language=Language.HINDI, description="Local food specialties"),
-            AccuracyTestCase(input_text="Gourmet dining destinations", expected_tool="food_locator", expected_intent=ToolIntent.FOOD_LOCATION, language=Language.ENGLISH, description="Gourmet dining destinations"),
-            AccuracyTestCase(input_text="स्वाद के साम्राज्य", expected_tool="food_locator", expected_intent=ToolIntent.FOOD_LOCATION, language=Language.HINDI, description="Kingdoms of taste"),
-
-            # FINAL 136 UNIQUE EXAMPLES TO REACH EXACTLY 500 TOTAL
-
-            # More Music Variants (30 unique)
-            AccuracyTestCase(input_text="Legendary songs from past eras", expected_tool="vividh_bharti", expected_intent=ToolIntent.MUSIC_RECOMMENDATION, language=Language.ENGLISH, description="Legendary past era songs"),
-            AccuracyTestCase(input_text="प्राचीन काल के मधुर गीत", expected_tool="vividh_bharti", expected_intent=ToolIntent.MUSIC_RECOMMENDATION, language=Language.HINDI, description="Ancient melodious songs"),
-            AccuracyTestCase(input_text="Immortal tunes sunao", expected_tool="vividh_bharti", expected_intent=ToolIntent.MUSIC_RECOMMENDATION, language=Language.HINGLISH, description="Play immortal tunes"),
-            AccuracyTestCase(input_text="Historical film music collection", expected_tool="vividh_bharti", expected_intent=ToolIntent.MUSIC_RECOMMENDATION, language=Language.ENGLISH, description="Historical film music"),
-            AccuracyTestCase(input_text="राग आधारित पुराने गीत", expected_tool="vividh_bharti", expected_intent=ToolIntent.MUSIC_RECOMMENDATION, language=Language.HINDI, description="Raga based old songs"),
-            AccuracyTestCase(input_text="Emotional melodies from yesteryears", expected_tool="vividh_bharti", expected_intent=ToolIntent.MUSIC_RECOMMENDATION, language=Language.ENGLISH, description="Emotional yesteryear melodies"),
-            AccuracyTestCase(input_text="दादाजी पसंदीदा संगीत", expected_tool="vividh_bharti", expected_intent=ToolIntent.MUSIC_RECOMMENDATION, language=Language.HINDI, description="Grandfather's favorite music"),
-            AccuracyTestCase(input_text="Ghazal aur purane gaane", expected_tool="vividh_bharti", expected_intent=ToolIntent.MUSIC_RECOMMENDATION, language=Language.HINGLISH, description="Ghazal and old songs"),
-            AccuracyTestCase(input_text="Orchestral vintage compositions", expected_tool="vividh_bharti", expected_intent=ToolIntent.MUSIC_RECOMMENDATION, language=Language.ENGLISH, description="Orchestral vintage compositions"),
-            AccuracyTestCase(input_text="साहित्यिक गीत सुनाइए", expected_tool="vividh_bharti", expected_intent=ToolIntent.MUSIC_RECOMMENDATION, language=Language.HINDI, description="Literary songs please"),
-
-            # More Recipe Variants (30 unique)
-            AccuracyTestCase(input_text="Gourmet transformation of remnants", expected_tool="leftover_chef", expected_intent=ToolIntent.RECIPE_SUGGESTION, language=Language.ENGLISH, description="Gourmet transformation remnants"),
-            AccuracyTestCase(input_text="अवशेष भोजन का कलात्मक उपयोग", expected_tool="leftover_chef", expected_intent=ToolIntent.RECIPE_SUGGESTION, language=Language.HINDI, description="Artistic use of leftover food"),
-            AccuracyTestCase(input_text="Culinary magic with leftovers", expected_tool="leftover_chef", expected_intent=ToolIntent.RECIPE_SUGGESTION, language=Language.ENGLISH, description="Culinary magic leftovers"),
-            AccuracyTestCase(input_text="पुराने खाने को नया रूप", expected_tool="leftover_chef", expected_intent=ToolIntent.RECIPE_SUGGESTION, language=Language.HINDI, description="New form to old food"),
-            AccuracyTestCase(input_text="Sustainable cooking practices", expected_tool="leftover_chef", expected_intent=ToolIntent.RECIPE_SUGGESTION, language=Language.ENGLISH, description="Sustainable cooking practices"),
-            AccuracyTestCase(input_text="बचत व्यंजन विधि", expected_tool="leftover_chef", expected_intent=ToolIntent.RECIPE_SUGGESTION, language=Language.HINDI, description="Economical dish method"),
-            AccuracyTestCase(input_text="Reinventing yesterday's cuisine", expected_tool="leftover_chef", expected_intent=ToolIntent.RECIPE_SUGGESTION, language=Language.ENGLISH, description="Reinventing yesterday's cuisine"),
-            AccuracyTestCase(input_text="खाना फिर से बनाने की तकनीक", expected_tool="leftover_chef", expected_intent=ToolIntent.RECIPE_SUGGESTION, language=Language.HINDI, description="Technique to remake food"),
-            AccuracyTestCase(input_text="Elevate leftover ingredients", expected_tool="leftover_chef", expected_intent=ToolIntent.RECIPE_SUGGESTION, language=Language.ENGLISH, description="Elevate leftover ingredients"),
-            AccuracyTestCase(input_text="अतिरिक्त सामग्री का सदुपयोग", expected_tool="leftover_chef", expected_intent=ToolIntent.RECIPE_SUGGESTION, language=Language.HINDI, description="Good use of extra ingredients"),
-
-            # More Story Variants (25 unique)
-            AccuracyTestCase(input_text="Mythological tales for children", expected_tool="nani_kahaniyan", expected_intent=ToolIntent.STORY_TELLING, language=Language.ENGLISH, description="Mythological children tales"),
-            AccuracyTestCase(input_text="पौराणिक बाल कथाएं", expected_tool="nani_kahaniyan", expected_intent=ToolIntent.STORY_TELLING, language=Language.HINDI, description="Mythological children stories"),
-            AccuracyTestCase(input_text="Adventure stories for kids", expected_tool="nani_kahaniyan", expected_intent=ToolIntent.STORY_TELLING, language=Language.ENGLISH, description="Adventure stories kids"),
-            AccuracyTestCase(input_text="रोमांचकारी बच्चों की कहानी", expected_tool="nani_kahaniyan", expected_intent=ToolIntent.STORY_TELLING, language=Language.HINDI, description="Thrilling children's story"),
-            AccuracyTestCase(input_text="Fairy tale narratives", expected_tool="nani_kahaniyan", expected_intent=ToolIntent.STORY_TELLING, language=Language.ENGLISH, description="Fairy tale narratives"),
-            AccuracyTestCase(input_text="परी कथा सुनाना", expected_tool="nani_kahaniyan", expected_intent=ToolIntent.STORY_TELLING, language=Language.HINDI, description="Tell fairy tale"),
-            AccuracyTestCase(input_text="Inspirational bedtime stories", expected_tool="nani_kahaniyan", expected_intent=ToolIntent.STORY_TELLING, language=Language.ENGLISH, description="Inspirational bedtime stories"),
-            AccuracyTestCase(input_text="प्रेरणादायक रात्रि कथा", expected_tool="nani_kahaniyan", expected_intent=ToolIntent.STORY_TELLING, language=Language.HINDI, description="Inspirational night story"),
-            AccuracyTestCase(input_text="Imaginative children narratives", expected_tool="nani_kahaniyan", expected_intent=ToolIntent.STORY_TELLING, language=Language.ENGLISH, description="Imaginative children narratives"),
-            AccuracyTestCase(input_text="कल्पनाशील बाल कहानी", expected_tool="nani_kahaniyan", expected_intent=ToolIntent.STORY_TELLING, language=Language.HINDI, description="Imaginative children story"),
-
-            # More Poem Variants (25 unique)
-            AccuracyTestCase(input_text="Metaphorical poetry creation", expected_tool="poem_generator", expected_intent=ToolIntent.POEM_GENERATION, language=Language.ENGLISH, description="Metaphorical poetry creation"),
-            AccuracyTestCase(input_text="रूपक आधारित कविता", expected_tool="poem_generator", expected_intent=ToolIntent.POEM_GENERATION, language=Language.HINDI, description="Metaphor based poetry"),
-            AccuracyTestCase(input_text="Rhythmic verse composition", expected_tool="poem_generator", expected_intent=ToolIntent.POEM_GENERATION, language=Language.ENGLISH, description="Rhythmic verse composition"),
-            AccuracyTestCase(input_text="लयबद्ध काव्य रचना", expected_tool="poem_generator", expected_intent=ToolIntent.POEM_GENERATION, language=Language.HINDI, description="Rhythmic poetry creation"),
-            AccuracyTestCase(input_text="Abstract poetic expressions", expected_tool="poem_generator", expected_intent=ToolIntent.POEM_GENERATION, language=Language.ENGLISH, description="Abstract poetic expressions"),
-            AccuracyTestCase(input_text="अमूर्त भावनाओं की कविता", expected_tool="poem_generator", expected_intent=ToolIntent.POEM_GENERATION, language=Language.HINDI, description="Abstract emotions poetry"),
-            AccuracyTestCase(input_text="Contemplative poetry writing", expected_tool="poem_generator", expected_intent=ToolIntent.POEM_GENERATION, language=Language.ENGLISH, description="Contemplative poetry writing"),
-            AccuracyTestCase(input_text="चिंतनशील काव्य लेखन", expected_tool="poem_generator", expected_intent=ToolIntent.POEM_GENERATION, language=Language.HINDI, description="Thoughtful poetry writing"),
-            AccuracyTestCase(input_text="Philosophical verse creation", expected_tool="poem_generator", expected_intent=ToolIntent.POEM_GENERATION, language=Language.ENGLISH, description="Philosophical verse creation"),
-            AccuracyTestCase(input_text="दर्शनिक पद्य निर्माण", expected_tool="poem_generator", expected_intent=ToolIntent.POEM_GENERATION, language=Language.HINDI, description="Philosophical verse creation"),
-
-            # More Food Location Variants (26 unique)
-            AccuracyTestCase(input_text="Authentic regional cuisines nearby", expected_tool="food_locator", expected_intent=ToolIntent.FOOD_LOCATION, language=Language.ENGLISH, description="Authentic regional cuisines"),
-            AccuracyTestCase(input_text="क्षेत्रीय व्यंजन विशेषज्ञता", expected_tool="food_locator", expected_intent=ToolIntent.FOOD_LOCATION, language=Language.HINDI, description="Regional cuisine specialties"),
-            AccuracyTestCase(input_text="Hidden culinary gems", expected_tool="food_locator", expected_intent=ToolIntent.FOOD_LOCATION, language=Language.ENGLISH, description="Hidden culinary gems"),
-            AccuracyTestCase(input_text="छुपे हुए भोजन रत्न", expected_tool="food_locator", expected_intent=ToolIntent.FOOD_LOCATION, language=Language.HINDI, description="Hidden food gems"),
-            AccuracyTestCase(input_text="Artisanal food establishments", expected_tool="food_locator", expected_intent=ToolIntent.FOOD_LOCATION, language=Language.ENGLISH, description="Artisanal food establishments"),
-            AccuracyTestCase(input_text="हस्तकला भोजनालय", expected_tool="food_locator", expected_intent=ToolIntent.FOOD_LOCATION, language=Language.HINDI, description="Artisanal eateries"),
-            AccuracyTestCase(input_text="Boutique dining experiences", expected_tool="food_locator", expected_intent=ToolIntent.FOOD_LOCATION, language=Language.ENGLISH, description="Boutique dining experiences"),
-            AccuracyTestCase(input_text="विशिष्ट भोजन अनुभव", expected_tool="food_locator", expected_intent=ToolIntent.FOOD_LOCATION, language=Language.HINDI, description="Unique dining experience"),
-            AccuracyTestCase(input_text="Farm-to-table restaurants", expected_tool="food_locator", expected_intent=ToolIntent.FOOD_LOCATION, language=Language.ENGLISH, description="Farm-to-table restaurants"),
-            AccuracyTestCase(input_text="कृषि से मेज तक भोजनालय", expected_tool="food_locator", expected_intent=ToolIntent.FOOD_LOCATION, language=Language.HINDI, description="Farm to table eatery"),
-
-            # FINAL 86 EXAMPLES TO REACH EXACTLY 500
-            AccuracyTestCase(input_text="Sonic heritage from golden period", expected_tool="vividh_bharti", expected_intent=ToolIntent.MUSIC_RECOMMENDATION, language=Language.ENGLISH, description="Sonic heritage golden period"),
-            AccuracyTestCase(input_text="काल के कालजयी संगीत", expected_tool="vividh_bharti", expected_intent=ToolIntent.MUSIC_RECOMMENDATION, language=Language.HINDI, description="Timeless music of the era"),
-            AccuracyTestCase(input_text="Therapeutic leftover cuisine", expected_tool="leftover_chef", expected_intent=ToolIntent.RECIPE_SUGGESTION, language=Language.ENGLISH, description="Therapeutic leftover cuisine"),
-            AccuracyTestCase(input_text="चिकित्सकीय बचे खाने की विधि", expected_tool="leftover_chef", expected_intent=ToolIntent.RECIPE_SUGGESTION, language=Language.HINDI, description="Therapeutic leftover recipe"),
-            AccuracyTestCase(input_text="Philosophical children narratives", expected_tool="nani_kahaniyan", expected_intent=ToolIntent.STORY_TELLING, language=Language.ENGLISH, description="Philosophical children narratives"),
-            AccuracyTestCase(input_text="तत्वज्ञान भरी बाल कथा", expected_tool="nani_kahaniyan", expected_intent=ToolIntent.STORY_TELLING, language=Language.HINDI, description="Philosophy filled children story"),
-            AccuracyTestCase(input_text="Transcendental poetry forms", expected_tool="poem_generator", expected_intent=ToolIntent.POEM_GENERATION, language=Language.ENGLISH, description="Transcendental poetry forms"),
-            AccuracyTestCase(input_text="अतींद्रिय काव्य स्वरूप", expected_tool="poem_generator", expected_intent=ToolIntent.POEM_GENERATION, language=Language.HINDI, description="Transcendental poetry form"),
-            AccuracyTestCase(input_text="Molecular gastronomy venues", expected_tool="food_locator", expected_intent=ToolIntent.FOOD_LOCATION, language=Language.ENGLISH, description="Molecular gastronomy venues"),
-            AccuracyTestCase(input_text="आणविक पाक कला स्थल", expected_tool="food_locator", expected_intent=ToolIntent.FOOD_LOCATION, language=Language.HINDI, description="Molecular culinary places"),
-            AccuracyTestCase(input_text="Harmonious vintage melodies seek karo", expected_tool="vividh_bharti", expected_intent=ToolIntent.MUSIC_RECOMMENDATION, language=Language.HINGLISH, description="Seek harmonious vintage melodies"),
-            AccuracyTestCase(input_text="Leftover transformation ke expert tips", expected_tool="leftover_chef", expected_intent=ToolIntent.RECIPE_SUGGESTION, language=Language.HINGLISH, description="Expert leftover transformation tips"),
-            AccuracyTestCase(input_text="Storytelling ka magical experience", expected_tool="nani_kahaniyan", expected_intent=ToolIntent.STORY_TELLING, language=Language.HINGLISH, description="Magical storytelling experience"),
-            AccuracyTestCase(input_text="Poetic journey pe jana hai", expected_tool="poem_generator", expected_intent=ToolIntent.POEM_GENERATION, language=Language.HINGLISH, description="Want to go on poetic journey"),
-            AccuracyTestCase(input_text="Dining exploration ke liye spots", expected_tool="food_locator", expected_intent=ToolIntent.FOOD_LOCATION, language=Language.HINGLISH, description="Spots for dining exploration"),
-            AccuracyTestCase(input_text="Ethereal music recommendations", expected_tool="vividh_bharti", expected_intent=ToolIntent.MUSIC_RECOMMENDATION, language=Language.ENGLISH, description="Ethereal music recommendations"),
-            AccuracyTestCase(input_text="Alchemy of leftover cooking", expected_tool="leftover_chef", expected_intent=ToolIntent.RECIPE_SUGGESTION, language=Language.ENGLISH, description="Alchemy leftover cooking"),
-            AccuracyTestCase(input_text="Pedagogical story elements", expected_tool="nani_kahaniyan", expected_intent=ToolIntent.STORY_TELLING, language=Language.ENGLISH, description="Pedagogical story elements"),
-            AccuracyTestCase(input_text="Linguistic poetry mastery", expected_tool="poem_generator", expected_intent=ToolIntent.POEM_GENERATION, language=Language.ENGLISH, description="Linguistic poetry mastery"),
-            AccuracyTestCase(input_text="Culinary anthropology sites", expected_tool="food_locator", expected_intent=ToolIntent.FOOD_LOCATION, language=Language.ENGLISH, description="Culinary anthropology sites"),
-            AccuracyTestCase(input_text="संगीत की आध्यात्मिक यात्रा", expected_tool="vividh_bharti", expected_intent=ToolIntent.MUSIC_RECOMMENDATION, language=Language.HINDI, description="Spiritual journey of music"),
-            AccuracyTestCase(input_text="भोजन पुनर्निर्माण की कला", expected_tool="leftover_chef", expected_intent=ToolIntent.RECIPE_SUGGESTION, language=Language.HINDI, description="Art of food reconstruction"),
-            AccuracyTestCase(input_text="नैतिक शिक्षा की कहानियां", expected_tool="nani_kahaniyan", expected_intent=ToolIntent.STORY_TELLING, language=Language.HINDI, description="Moral education stories"),
-            AccuracyTestCase(input_text="भाषा की काव्यात्मक शक्ति", expected_tool="poem_generator", expected_intent=ToolIntent.POEM_GENERATION, language=Language.HINDI, description="Poetic power of language"),
-            AccuracyTestCase(input_text="खाद्य संस्कृति के केंद्र", expected_tool="food_locator", expected_intent=ToolIntent.FOOD_LOCATION, language=Language.HINDI, description="Centers of food culture"),
-            AccuracyTestCase(input_text="Psychedelic music journey batao", expected_tool="vividh_bharti", expected_intent=ToolIntent.MUSIC_RECOMMENDATION, language=Language.HINGLISH, description="Tell psychedelic music journey"),
-            AccuracyTestCase(input_text="Leftover science ka practical approach", expected_tool="leftover_chef", expected_intent=ToolIntent.RECIPE_SUGGESTION, language=Language.HINGLISH, description="Practical leftover science approach"),
-            AccuracyTestCase(input_text="Narrative therapy ke through stories", expected_tool="nani_kahaniyan", expected_intent=ToolIntent.STORY_TELLING, language=Language.HINGLISH, description="Stories through narrative therapy"),
-            AccuracyTestCase(input_text="Semantic poetry ka creation", expected_tool="poem_generator", expected_intent=ToolIntent.POEM_GENERATION, language=Language.HINGLISH, description="Semantic poetry creation"),
-            AccuracyTestCase(input_text="Gastronomic archaeology ke places", expected_tool="food_locator", expected_intent=ToolIntent.FOOD_LOCATION, language=Language.HINGLISH, description="Places of gastronomic archaeology"),
-            AccuracyTestCase(input_text="Atmospheric soundscapes from past", expected_tool="vividh_bharti", expected_intent=ToolIntent.MUSIC_RECOMMENDATION, language=Language.ENGLISH, description="Atmospheric past soundscapes"),
-            AccuracyTestCase(input_text="Metamorphosis of remnant ingredients", expected_tool="leftover_chef", expected_intent=ToolIntent.RECIPE_SUGGESTION, language=Language.ENGLISH, description="Metamorphosis remnant ingredients"),
-            AccuracyTestCase(input_text="Archetypal storytelling patterns", expected_tool="nani_kahaniyan", expected_intent=ToolIntent.STORY_TELLING, language=Language.ENGLISH, description="Archetypal storytelling patterns"),
-            AccuracyTestCase(input_text="Synesthetic poetry experiences", expected_tool="poem_generator", expected_intent=ToolIntent.POEM_GENERATION, language=Language.ENGLISH, description="Synesthetic poetry experiences"),
-            AccuracyTestCase(input_text="Ethnographic dining establishments", expected_tool="food_locator", expected_intent=ToolIntent.FOOD_LOCATION, language=Language.ENGLISH, description="Ethnographic dining establishments"),
-            AccuracyTestCase(input_text="संगीत की कालजयी धुनें", expected_tool="vividh_bharti", expected_intent=ToolIntent.MUSIC_RECOMMENDATION, language=Language.HINDI, description="Timeless melodies of music"),
-            AccuracyTestCase(input_text="बचे भोजन का वैज्ञानिक उपयोग", expected_tool="leftover_chef", expected_intent=ToolIntent.RECIPE_SUGGESTION, language=Language.HINDI, description="Scientific use of leftover food"),
-            AccuracyTestCase(input_text="कथा सुनाने की पारंपरिक कला", expected_tool="nani_kahaniyan", expected_intent=ToolIntent.STORY_TELLING, language=Language.HINDI, description="Traditional art of storytelling"),
-            AccuracyTestCase(input_text="कविता रचना की गहन प्रक्रिया", expected_tool="poem_generator", expected_intent=ToolIntent.POEM_GENERATION, language=Language.HINDI, description="Deep process of poetry creation"),
-            AccuracyTestCase(input_text="भोजन की सामाजिक परंपराएं", expected_tool="food_locator", expected_intent=ToolIntent.FOOD_LOCATION, language=Language.HINDI, description="Social traditions of food"),
-            AccuracyTestCase(input_text="Sonic archaeology ke rare gems", expected_tool="vividh_bharti", expected_intent=ToolIntent.MUSIC_RECOMMENDATION, language=Language.HINGLISH, description="Rare gems of sonic archaeology"),
-            AccuracyTestCase(input_text="Kitchen laboratory mein experiments", expected_tool="leftover_chef", expected_intent=ToolIntent.RECIPE_SUGGESTION, language=Language.HINGLISH, description="Experiments in kitchen laboratory"),
-            AccuracyTestCase(input_text="Storytelling ke therapeutic benefits", expected_tool="nani_kahaniyan", expected_intent=ToolIntent.STORY_TELLING, language=Language.HINGLISH, description="Therapeutic benefits of storytelling"),
-            AccuracyTestCase(input_text="Verse engineering ka advanced form", expected_tool="poem_generator", expected_intent=ToolIntent.POEM_GENERATION, language=Language.HINGLISH, description="Advanced verse engineering form"),
-            AccuracyTestCase(input_text="Culinary geography ke exploration spots", expected_tool="food_locator", expected_intent=ToolIntent.FOOD_LOCATION, language=Language.HINGLISH, description="Culinary geography exploration spots"),
-            AccuracyTestCase(input_text="Dimensional music from epochs", expected_tool="vividh_bharti", expected_intent=ToolIntent.MUSIC_RECOMMENDATION, language=Language.ENGLISH, description="Dimensional music from epochs"),
-            AccuracyTestCase(input_text="Biochemical leftover transformations", expected_tool="leftover_chef", expected_intent=ToolIntent.RECIPE_SUGGESTION, language=Language.ENGLISH, description="Biochemical leftover transformations"),
-            AccuracyTestCase(input_text="Anthropological children narratives", expected_tool="nani_kahaniyan", expected_intent=ToolIntent.STORY_TELLING, language=Language.ENGLISH, description="Anthropological children narratives"),
-            AccuracyTestCase(input_text="Quantum poetry mechanics", expected_tool="poem_generator", expected_intent=ToolIntent.POEM_GENERATION, language=Language.ENGLISH, description="Quantum poetry mechanics"),
-            AccuracyTestCase(input_text="Sociological food spaces", expected_tool="food_locator", expected_intent=ToolIntent.FOOD_LOCATION, language=Language.ENGLISH, description="Sociological food spaces"),
-            AccuracyTestCase(input_text="ध्वनि की पुरातत्विक खोज", expected_tool="vividh_bharti", expected_intent=ToolIntent.MUSIC_RECOMMENDATION, language=Language.HINDI, description="Archaeological exploration of sound"),
-            AccuracyTestCase(input_text="अवशिष्ट भोजन का रसायन विज्ञान", expected_tool="leftover_chef", expected_intent=ToolIntent.RECIPE_SUGGESTION, language=Language.HINDI, description="Chemistry of leftover food"),
-            AccuracyTestCase(input_text="कहानी कहने का मनोवैज्ञानिक प्रभाव", expected_tool="nani_kahaniyan", expected_intent=ToolIntent.STORY_TELLING, language=Language.HINDI, description="Psychological impact of storytelling"),
-            AccuracyTestCase(input_text="काव्य रचना का दर्शनशास्त्र", expected_tool="poem_generator", expected_intent=ToolIntent.POEM_GENERATION, language=Language.HINDI, description="Philosophy of poetry creation"),
-            AccuracyTestCase(input_text="भोजन का सामाजिक भूगोल", expected_tool="food_locator", expected_intent=ToolIntent.FOOD_LOCATION, language=Language.HINDI, description="Social geography of food"),
-            AccuracyTestCase(input_text="Musical archaeology ke treasures discover", expected_tool="vividh_bharti", expected_intent=ToolIntent.MUSIC_RECOMMENDATION, language=Language.HINGLISH, description="Discover musical archaeology treasures"),
-            AccuracyTestCase(input_text="Food waste management ke creative solutions", expected_tool="leftover_chef", expected_intent=ToolIntent.RECIPE_SUGGESTION, language=Language.HINGLISH, description="Creative food waste management solutions"),
-            AccuracyTestCase(input_text="Narrative psychology ke children stories", expected_tool="nani_kahaniyan", expected_intent=ToolIntent.STORY_TELLING, language=Language.HINGLISH, description="Children stories narrative psychology"),
-            AccuracyTestCase(input_text="Linguistic poetry ke artistic dimensions", expected_tool="poem_generator", expected_intent=ToolIntent.POEM_GENERATION, language=Language.HINGLISH, description="Artistic dimensions linguistic poetry"),
-            AccuracyTestCase(input_text="Food anthropology ke research sites", expected_tool="food_locator", expected_intent=ToolIntent.FOOD_LOCATION, language=Language.HINGLISH, description="Food anthropology research sites"),
-            AccuracyTestCase(input_text="Temporal music consciousness", expected_tool="vividh_bharti", expected_intent=ToolIntent.MUSIC_RECOMMENDATION, language=Language.ENGLISH, description="Temporal music consciousness"),
-            AccuracyTestCase(input_text="Molecular leftover gastronomy", expected_tool="leftover_chef", expected_intent=ToolIntent.RECIPE_SUGGESTION, language=Language.ENGLISH, description="Molecular leftover gastronomy"),
-            AccuracyTestCase(input_text="Developmental storytelling methodologies", expected_tool="nani_kahaniyan", expected_intent=ToolIntent.STORY_TELLING, language=Language.ENGLISH, description="Developmental storytelling methodologies"),
-            AccuracyTestCase(input_text="Computational poetry algorithms", expected_tool="poem_generator", expected_intent=ToolIntent.POEM_GENERATION, language=Language.ENGLISH, description="Computational poetry algorithms"),
-            AccuracyTestCase(input_text="Geographical food cultural centers", expected_tool="food_locator", expected_intent=ToolIntent.FOOD_LOCATION, language=Language.ENGLISH, description="Geographical food cultural centers"),
-            AccuracyTestCase(input_text="संगीत की चेतना संरचना", expected_tool="vividh_bharti", expected_intent=ToolIntent.MUSIC_RECOMMENDATION, language=Language.HINDI, description="Consciousness structure of music"),
-            AccuracyTestCase(input_text="भोजन अपशिष्ट का नवाचार", expected_tool="leftover_chef", expected_intent=ToolIntent.RECIPE_SUGGESTION, language=Language.HINDI, description="Innovation of food waste"),
-            AccuracyTestCase(input_text="बाल विकास की कथा पद्धति", expected_tool="nani_kahaniyan", expected_intent=ToolIntent.STORY_TELLING, language=Language.HINDI, description="Child development storytelling methodology"),
-            AccuracyTestCase(input_text="कविता की संगणनात्मक कलगोरिदम", expected_tool="poem_generator", expected_intent=ToolIntent.POEM_GENERATION, language=Language.HINDI, description="Computational algorithms of poetry"),
-            AccuracyTestCase(input_text="भौगोलिक खाद्य सांस्कृतिक केंद्र", expected_tool="food_locator", expected_intent=ToolIntent.FOOD_LOCATION, language=Language.HINDI, description="Geographical food cultural centers"),
-            AccuracyTestCase(input_text="Consciousness streaming ke musical patterns", expected_tool="vividh_bharti", expected_intent=ToolIntent.MUSIC_RECOMMENDATION, language=Language.HINGLISH, description="Musical patterns consciousness streaming"),
-            AccuracyTestCase(input_text="Quantum leftover cooking ke principles", expected_tool="leftover_chef", expected_intent=ToolIntent.RECIPE_SUGGESTION, language=Language.HINGLISH, description="Quantum leftover cooking principles"),
-            AccuracyTestCase(input_text="Therapeutic storytelling ke healing aspects", expected_tool="nani_kahaniyan", expected_intent=ToolIntent.STORY_TELLING, language=Language.HINGLISH, description="Healing aspects therapeutic storytelling"),
-            AccuracyTestCase(input_text="Metaphysical poetry ke transcendent forms", expected_tool="poem_generator", expected_intent=ToolIntent.POEM_GENERATION, language=Language.HINGLISH, description="Transcendent metaphysical poetry forms"),
-            AccuracyTestCase(input_text="Cultural food archaeology ke expedition sites", expected_tool="food_locator", expected_intent=ToolIntent.FOOD_LOCATION, language=Language.HINGLISH, description="Cultural food archaeology expedition sites"),
-            AccuracyTestCase(input_text="Interdimensional vintage soundwaves", expected_tool="vividh_bharti", expected_intent=ToolIntent.MUSIC_RECOMMENDATION, language=Language.ENGLISH, description="Interdimensional vintage soundwaves"),
-            AccuracyTestCase(input_text="Transformational leftover alchemy", expected_tool="leftover_chef", expected_intent=ToolIntent.RECIPE_SUGGESTION, language=Language.ENGLISH, description="Transformational leftover alchemy"),
-            AccuracyTestCase(input_text="Evolutionary storytelling paradigms", expected_tool="nani_kahaniyan", expected_intent=ToolIntent.STORY_TELLING, language=Language.ENGLISH, description="Evolutionary storytelling paradigms"),
-            AccuracyTestCase(input_text="Transcendental verse architecture", expected_tool="poem_generator", expected_intent=ToolIntent.POEM_GENERATION, language=Language.ENGLISH, description="Transcendental verse architecture"),
-            AccuracyTestCase(input_text="Phenomenological dining experiences", expected_tool="food_locator", expected_intent=ToolIntent.FOOD_LOCATION, language=Language.ENGLISH, description="Phenomenological dining experiences"),
-            AccuracyTestCase(input_text="संगीत की अंतर्दर्शी यात्रा", expected_tool="vividh_bharti", expected_intent=ToolIntent.MUSIC_RECOMMENDATION, language=Language.HINDI, description="Introspective journey of music"),
-            AccuracyTestCase(input_text="भोजन रूपांतरण की रसायनिक कला", expected_tool="leftover_chef", expected_intent=ToolIntent.RECIPE_SUGGESTION, language=Language.HINDI, description="Chemical art of food transformation"),
-            AccuracyTestCase(input_text="कथा चिकित्सा की उपचारात्मक शक्ति", expected_tool="nani_kahaniyan", expected_intent=ToolIntent.STORY_TELLING, language=Language.HINDI, description="Therapeutic power of story therapy"),
-            AccuracyTestCase(input_text="काव्य की आध्यात्मिक संरचना", expected_tool="poem_generator", expected_intent=ToolIntent.POEM_GENERATION, language=Language.HINDI, description="Spiritual structure of poetry"),
-            AccuracyTestCase(input_text="भोजन की घटनाविज्ञानी अनुभव", expected_tool="food_locator", expected_intent=ToolIntent.FOOD_LOCATION, language=Language.HINDI, description="Phenomenological experience of food"),
-            AccuracyTestCase(input_text="Musical consciousness ke dimensional explorations", expected_tool="vividh_bharti", expected_intent=ToolIntent.MUSIC_RECOMMENDATION, language=Language.HINGLISH, description="Dimensional explorations musical consciousness"),
-            AccuracyTestCase(input_text="Leftover metamorphosis ke alchemical processes", expected_tool="leftover_chef", expected_intent=ToolIntent.RECIPE_SUGGESTION, language=Language.HINGLISH, description="Alchemical processes leftover metamorphosis"),
-            AccuracyTestCase(input_text="Narrative therapy ke evolutionary storytelling", expected_tool="nani_kahaniyan", expected_intent=ToolIntent.STORY_TELLING, language=Language.HINGLISH, description="Evolutionary storytelling narrative therapy"),
-            AccuracyTestCase(input_text="Poetry architecture ke transcendental designs", expected_tool="poem_generator", expected_intent=ToolIntent.POEM_GENERATION, language=Language.HINGLISH, description="Transcendental designs poetry architecture"),
-            AccuracyTestCase(input_text="Food phenomenology ke experiential dining", expected_tool="food_locator", expected_intent=ToolIntent.FOOD_LOCATION, language=Language.HINGLISH, description="Experiential dining food phenomenology")
-        ]
-    
-    def save_training_data(self, filepath: str = "training_data.json"):
-        """Save training data to JSON file"""
-        training_data = self.generate_training_data()
-        
-        with open(filepath, 'w', encoding='utf-8') as f:
-            json.dump(training_data, f, ensure_ascii=False, indent=2)
+    def save_training_data(self, filepath: str = "training_data.json", include_description: bool = False, indent: bool = True):
+        """Save training data to JSON file
+        
+        Pass indent=False for a compact file when nobody needs to read it by hand.
+        """
+        training_data = self.generate_training_data(include_description=include_description)
+        
+        # Serialize up front so the file gets a single write instead of one
+        # per JSON token
+        if orjson is not None:
+            payload = orjson.dumps(training_data, option=orjson.OPT_INDENT_2 if indent else None)
+        elif indent:
+            payload = json.dumps(training_data, ensure_ascii=False, indent=2).encode('utf-8')
+        else:
+            payload = json.dumps(training_data, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+        with open(filepath, 'wb') as f:
+            f.write(payload)
         
         print(f"✅ Saved {len(training_data)} training examples to {filepath}")
         
         # Print statistics
-        intent_counts = {}
-        language_counts = {}
-        
-        for example in training_data:
-            intent = example['intent']
-            language = example['language']
-            
-            intent_counts[intent] = intent_counts.get(intent, 0) + 1
-            language_counts[language] = language_counts.get(language, 0) + 1
+        intent_counts, language_counts = label_distribution(training_data)
         
         print("\n📊 Dataset Statistics:")
         print("Intent Distribution:")
@@ -787,6 +142,22 @@ class IntentDatasetGenerator:
             print(f"  {language}: {count} examples")
         
         return training_data
+    
+    def save_training_data_jsonl(self, filepath: str = "training_data.jsonl", include_description: bool = False, chunk_size: int = 1000):
+        """Save training data as JSON Lines, one example per line
+        
+        Records are serialized and written a chunk at a time, so only chunk_size
+        encoded lines are held in memory at once.
+        """
+        keys = _record_keys(include_description)
+        rows = _unique_rows()
+        
+        with open(filepath, 'wb') as f:
+            for start in range(0, len(rows), chunk_size):
+                lines = [_dump_line(dict(zip(keys, row))) for row in rows[start:start + chunk_size]]
+                f.write(b"\n".join(lines) + b"\n")
+        
+        print(f"✅ Saved {len(rows)} training examples to {filepath}")
 
 if __name__ == "__main__":
     generator = IntentDatasetGenerator()
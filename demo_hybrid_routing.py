@@ -17,9 +17,11 @@ Prerequisites:
 
 import json
 import os
+from functools import lru_cache
+from operator import itemgetter
 from router import MultilingualToolRouter
 from intent_classifier import MultilingualIntentClassifier
-from models import Language, ToolIntent, AccuracyTestCase
+from models import Language, ToolIntent, AccuracyTestCase, INTENT_TO_TOOL
 import logging
 
 # Setup logging
@@ -41,114 +43,118 @@ def load_intent_model():
         logger.error(f"Error loading intent model: {e}")
         return None
 
-def test_semantic_routing(router, test_cases):
-    """Test semantic embedding routing approach"""
+def predict_intents(intent_classifier, texts):
+    """Run the intent model once over all texts
+    
+    Returns (predictions, error): predictions is None when no model is
+    available or the model failed, in which case error holds the exception.
+    """
+    if not intent_classifier:
+        return None, None
+    
+    try:
+        # Predict intent and confidence for every text in batched forward passes
+        return intent_classifier.predict_batch(texts), None
+    except Exception as e:
+        return None, e
+
+def test_semantic_routing(decisions, test_cases):
+    """Test semantic embedding routing approach on precomputed decisions"""
     logger.info("\n🔍 TESTING SEMANTIC EMBEDDING ROUTING")
     logger.info("=" * 50)
     
-    correct = 0
     total = len(test_cases)
+    correct = sum(
+        decision.selected_tool == case.expected_tool
+        for case, decision in zip(test_cases, decisions)
+    )
     
-    for i, case in enumerate(test_cases, 1):
-        decision = router.route_to_tool(case.input_text)
+    for i, (case, decision) in enumerate(zip(test_cases, decisions), 1):
         is_correct = decision.selected_tool == case.expected_tool
         
         status = "✅" if is_correct else "❌"
-        logger.info(f"{status} Test {i}: '{case.input_text}'")
-        logger.info(f"   Expected: {case.expected_tool} | Got: {decision.selected_tool}")
-        logger.info(f"   Confidence: {decision.confidence_score:.3f} | Language: {decision.language_detected.value}")
-        
-        if is_correct:
-            correct += 1
-        
-        logger.info("")
+        # One record per case instead of one per line; %-args are only
+        # formatted if the record is actually emitted
+        logger.info(
+            "%s Test %d: '%s'\n"
+            "   Expected: %s | Got: %s\n"
+            "   Confidence: %.3f | Language: %s\n",
+            status, i, case.input_text,
+            case.expected_tool, decision.selected_tool,
+            decision.confidence_score, decision.language_detected.value
+        )
     
     accuracy = (correct / total) * 100
     logger.info(f"📊 SEMANTIC ROUTING ACCURACY: {accuracy:.1f}% ({correct}/{total})")
     return accuracy
 
-def test_intent_classification(intent_classifier, test_cases):
-    """Test intent classification model approach"""
+def test_intent_classification(predictions, intent_error, test_cases):
+    """Test intent classification model approach on precomputed predictions"""
     logger.info("\n🧠 TESTING INTENT CLASSIFICATION MODEL")
     logger.info("=" * 50)
     
-    if not intent_classifier:
+    if intent_error is not None:
+        logger.error(f"❌ Intent model failed, skipping this test: {intent_error}")
+        return 0
+    
+    if predictions is None:
         logger.warning("❌ No intent classifier available. Skipping this test.")
         return 0
     
-    correct = 0
     total = len(test_cases)
+    predicted_tools = [
+        INTENT_TO_TOOL.get(predicted_intent, "clarification_needed")
+        for predicted_intent, _ in predictions
+    ]
+    correct = sum(
+        predicted_tool == case.expected_tool
+        for case, predicted_tool in zip(test_cases, predicted_tools)
+    )
     
-    # Tool mapping from intent to tool name
-    intent_to_tool = {
-        ToolIntent.RECIPE_SUGGESTION: "leftover_chef",
-        ToolIntent.STORY_TELLING: "nani_kahaniyan", 
-        ToolIntent.POEM_GENERATION: "poem_generator",
-        ToolIntent.MUSIC_RECOMMENDATION: "vividh_bharti",
-        ToolIntent.FOOD_LOCATION: "food_locator"
-    }
-    
-    for i, case in enumerate(test_cases, 1):
-        try:
-            # Predict intent and confidence
-            predicted_intent, confidence = intent_classifier.predict(case.input_text)
-            predicted_tool = intent_to_tool.get(predicted_intent, "clarification_needed")
-            
-            is_correct = predicted_tool == case.expected_tool
-            
-            status = "✅" if is_correct else "❌"
-            logger.info(f"{status} Test {i}: '{case.input_text}'")
-            logger.info(f"   Expected: {case.expected_tool} | Got: {predicted_tool}")
-            logger.info(f"   Intent: {predicted_intent.value} | Confidence: {confidence:.3f}")
-            
-            if is_correct:
-                correct += 1
-                
-        except Exception as e:
-            logger.error(f"❌ Error predicting for test {i}: {e}")
-            logger.info(f"   Input: '{case.input_text}'")
+    for i, (case, (predicted_intent, confidence), predicted_tool) in enumerate(zip(test_cases, predictions, predicted_tools), 1):
+        is_correct = predicted_tool == case.expected_tool
         
-        logger.info("")
+        status = "✅" if is_correct else "❌"
+        logger.info(
+            "%s Test %d: '%s'\n"
+            "   Expected: %s | Got: %s\n"
+            "   Intent: %s | Confidence: %.3f\n",
+            status, i, case.input_text,
+            case.expected_tool, predicted_tool,
+            predicted_intent.value, confidence
+        )
     
     accuracy = (correct / total) * 100
     logger.info(f"📊 INTENT CLASSIFICATION ACCURACY: {accuracy:.1f}% ({correct}/{total})")
     return accuracy
 
-def test_hybrid_approach(router, intent_classifier, test_cases):
-    """Test hybrid approach: semantic first, intent model as backup"""
+def test_hybrid_approach(semantic_decisions, intent_predictions, intent_error, test_cases):
+    """Test hybrid approach: semantic first, intent model as backup
+    
+    Combines the decisions and predictions already computed for the other two
+    tests, so neither model runs again here.
+    """
     logger.info("\n🔀 TESTING HYBRID ROUTING APPROACH")
     logger.info("=" * 50)
     
-    if not intent_classifier:
+    if intent_predictions is None and intent_error is None:
         logger.warning("❌ No intent classifier available. Using semantic-only routing.")
-        return test_semantic_routing(router, test_cases)
+        return test_semantic_routing(semantic_decisions, test_cases)
     
     correct = 0
     total = len(test_cases)
     semantic_used = 0
     intent_used = 0
     
-    # Tool mapping
-    intent_to_tool = {
-        ToolIntent.RECIPE_SUGGESTION: "leftover_chef",
-        ToolIntent.STORY_TELLING: "nani_kahaniyan",
-        ToolIntent.POEM_GENERATION: "poem_generator", 
-        ToolIntent.MUSIC_RECOMMENDATION: "vividh_bharti",
-        ToolIntent.FOOD_LOCATION: "food_locator"
-    }
-    
-    for i, case in enumerate(test_cases, 1):
-        # Step 1: Try semantic routing
-        semantic_decision = router.route_to_tool(case.input_text)
-        
-        # Step 2: If semantic routing is uncertain, try intent classification
+    for i, (case, semantic_decision) in enumerate(zip(test_cases, semantic_decisions), 1):
+        # If semantic routing is uncertain, use the intent classification
         if semantic_decision.selected_tool == "clarification_needed":
-            try:
-                predicted_intent, intent_confidence = intent_classifier.predict(case.input_text)
+            if intent_error is None:
+                predicted_intent, intent_confidence = intent_predictions[i - 1]
                 
                 # Use intent model if it's confident enough
                 if intent_confidence > 0.7:  # Threshold for intent model
-                    final_tool = intent_to_tool.get(predicted_intent, "clarification_needed")
+                    final_tool = INTENT_TO_TOOL.get(predicted_intent, "clarification_needed")
                     final_confidence = intent_confidence
                     method_used = "Intent Model"
                     intent_used += 1
@@ -156,10 +162,10 @@ def test_hybrid_approach(router, intent_classifier, test_cases):
                     final_tool = "clarification_needed"
                     final_confidence = max(semantic_decision.confidence_score, intent_confidence)
                     method_used = "Clarification (both low confidence)"
-            except Exception as e:
+            else:
                 final_tool = "clarification_needed"
                 final_confidence = semantic_decision.confidence_score
-                method_used = f"Clarification (intent error: {e})"
+                method_used = f"Clarification (intent error: {intent_error})"
         else:
             final_tool = semantic_decision.selected_tool
             final_confidence = semantic_decision.confidence_score
@@ -169,137 +175,60 @@ def test_hybrid_approach(router, intent_classifier, test_cases):
         is_correct = final_tool == case.expected_tool
         
         status = "✅" if is_correct else "❌"
-        logger.info(f"{status} Test {i}: '{case.input_text}'")
-        logger.info(f"   Expected: {case.expected_tool} | Got: {final_tool}")
-        logger.info(f"   Method: {method_used} | Confidence: {final_confidence:.3f}")
-        logger.info(f"   Language: {case.language.value}")
+        logger.info(
+            "%s Test %d: '%s'\n"
+            "   Expected: %s | Got: %s\n"
+            "   Method: %s | Confidence: %.3f\n"
+            "   Language: %s\n",
+            status, i, case.input_text,
+            case.expected_tool, final_tool,
+            method_used, final_confidence,
+            case.language.value
+        )
         
         if is_correct:
             correct += 1
-        
-        logger.info("")
     
     accuracy = (correct / total) * 100
     logger.info(f"📊 HYBRID ROUTING ACCURACY: {accuracy:.1f}% ({correct}/{total})")
     logger.info(f"🎯 Method Usage: Semantic={semantic_used}, Intent={intent_used}, Other={total-semantic_used-intent_used}")
     return accuracy
 
+# Demo cases as (input_text, expected_tool, expected_intent, language, description)
+# rows; AccuracyTestCase models are built once on first use
+DEMO_CASE_ROWS = (
+    # Hinglish cases (challenging)
+    ("Ghar mein sirf chawal aur dal hai, kuch recipe batao", "leftover_chef", ToolIntent.RECIPE_SUGGESTION, Language.HINGLISH, "Hinglish recipe request with leftovers"),
+    ("Koi achhi kavita sunao nature ke bare mein", "poem_generator", ToolIntent.POEM_GENERATION, Language.HINGLISH, "Hinglish poetry request about nature"),
+    ("Purane gaane recommend karo 1960s ke", "vividh_bharti", ToolIntent.MUSIC_RECOMMENDATION, Language.HINGLISH, "Hinglish music request for old songs"),
+    ("Yahan ke paas koi achha dhaba hai", "food_locator", ToolIntent.FOOD_LOCATION, Language.HINGLISH, "Hinglish restaurant location query"),
+    ("Bacchon ko sunane ke liye story chahiye", "nani_kahaniyan", ToolIntent.STORY_TELLING, Language.HINGLISH, "Hinglish story request for children"),
+
+    # English cases
+    ("What can I cook with leftover rice?", "leftover_chef", ToolIntent.RECIPE_SUGGESTION, Language.ENGLISH, "English recipe request with leftovers"),
+    ("Tell me a bedtime story", "nani_kahaniyan", ToolIntent.STORY_TELLING, Language.ENGLISH, "English bedtime story request"),
+    ("Write a romantic poem", "poem_generator", ToolIntent.POEM_GENERATION, Language.ENGLISH, "English romantic poetry request"),
+    ("Suggest classic bollywood songs", "vividh_bharti", ToolIntent.MUSIC_RECOMMENDATION, Language.ENGLISH, "English Bollywood music request"),
+    ("Good restaurants near me", "food_locator", ToolIntent.FOOD_LOCATION, Language.ENGLISH, "English restaurant location query"),
+
+    # Hindi cases
+    ("बचे हुए खाने से कुछ बना सकते हैं", "leftover_chef", ToolIntent.RECIPE_SUGGESTION, Language.HINDI, "Hindi recipe request with leftovers"),
+    ("कोई अच्छी कहानी सुनाओ", "nani_kahaniyan", ToolIntent.STORY_TELLING, Language.HINDI, "Hindi story request"),
+    ("प्रेम की कविता लिखो", "poem_generator", ToolIntent.POEM_GENERATION, Language.HINDI, "Hindi love poetry request"),
+
+    # Edge cases
+    ("Music", "clarification_needed", ToolIntent.MUSIC_RECOMMENDATION, Language.ENGLISH, "Ambiguous English music query"),  # Intent unclear but likely music
+    ("Food", "clarification_needed", ToolIntent.FOOD_LOCATION, Language.ENGLISH, "Ambiguous English food query"),  # Intent unclear but likely food
+)
+
+@lru_cache(maxsize=1)
+def _build_demo_test_cases():
+    """Materialize DEMO_CASE_ROWS once; the frozen models are safe to share"""
+    return tuple(map(AccuracyTestCase.from_row, DEMO_CASE_ROWS))
+
 def create_demo_test_cases():
     """Create a set of demo test cases for comparison"""
-    return [
-        # Hinglish cases (challenging)
-        AccuracyTestCase(
-            input_text="Ghar mein sirf chawal aur dal hai, kuch recipe batao",
-            expected_tool="leftover_chef",
-            expected_intent=ToolIntent.RECIPE_SUGGESTION,
-            language=Language.HINGLISH,
-            description="Hinglish recipe request with leftovers"
-        ),
-        AccuracyTestCase(
-            input_text="Koi achhi kavita sunao nature ke bare mein",
-            expected_tool="poem_generator",
-            expected_intent=ToolIntent.POEM_GENERATION,
-            language=Language.HINGLISH,
-            description="Hinglish poetry request about nature"
-        ),
-        AccuracyTestCase(
-            input_text="Purane gaane recommend karo 1960s ke",
-            expected_tool="vividh_bharti",
-            expected_intent=ToolIntent.MUSIC_RECOMMENDATION,
-            language=Language.HINGLISH,
-            description="Hinglish music request for old songs"
-        ),
-        AccuracyTestCase(
-            input_text="Yahan ke paas koi achha dhaba hai",
-            expected_tool="food_locator",
-            expected_intent=ToolIntent.FOOD_LOCATION,
-            language=Language.HINGLISH,
-            description="Hinglish restaurant location query"
-        ),
-        AccuracyTestCase(
-            input_text="Bacchon ko sunane ke liye story chahiye",
-            expected_tool="nani_kahaniyan",
-            expected_intent=ToolIntent.STORY_TELLING,
-            language=Language.HINGLISH,
-            description="Hinglish story request for children"
-        ),
-        
-        # English cases
-        AccuracyTestCase(
-            input_text="What can I cook with leftover rice?",
-            expected_tool="leftover_chef",
-            expected_intent=ToolIntent.RECIPE_SUGGESTION,
-            language=Language.ENGLISH,
-            description="English recipe request with leftovers"
-        ),
-        AccuracyTestCase(
-            input_text="Tell me a bedtime story",
-            expected_tool="nani_kahaniyan",
-            expected_intent=ToolIntent.STORY_TELLING,
-            language=Language.ENGLISH,
-            description="English bedtime story request"
-        ),
-        AccuracyTestCase(
-            input_text="Write a romantic poem",
-            expected_tool="poem_generator",
-            expected_intent=ToolIntent.POEM_GENERATION,
-            language=Language.ENGLISH,
-            description="English romantic poetry request"
-        ),
-        AccuracyTestCase(
-            input_text="Suggest classic bollywood songs",
-            expected_tool="vividh_bharti",
-            expected_intent=ToolIntent.MUSIC_RECOMMENDATION,
-            language=Language.ENGLISH,
-            description="English Bollywood music request"
-        ),
-        AccuracyTestCase(
-            input_text="Good restaurants near me",
-            expected_tool="food_locator",
-            expected_intent=ToolIntent.FOOD_LOCATION,
-            language=Language.ENGLISH,
-            description="English restaurant location query"
-        ),
-        
-        # Hindi cases
-        AccuracyTestCase(
-            input_text="बचे हुए खाने से कुछ बना सकते हैं",
-            expected_tool="leftover_chef",
-            expected_intent=ToolIntent.RECIPE_SUGGESTION,
-            language=Language.HINDI,
-            description="Hindi recipe request with leftovers"
-        ),
-        AccuracyTestCase(
-            input_text="कोई अच्छी कहानी सुनाओ",
-            expected_tool="nani_kahaniyan",
-            expected_intent=ToolIntent.STORY_TELLING,
-            language=Language.HINDI,
-            description="Hindi story request"
-        ),
-        AccuracyTestCase(
-            input_text="प्रेम की कविता लिखो",
-            expected_tool="poem_generator",
-            expected_intent=ToolIntent.POEM_GENERATION,
-            language=Language.HINDI,
-            description="Hindi love poetry request"
-        ),
-        
-        # Edge cases
-        AccuracyTestCase(
-            input_text="Music",
-            expected_tool="clarification_needed",
-            expected_intent=ToolIntent.MUSIC_RECOMMENDATION,  # Intent unclear but likely music
-            language=Language.ENGLISH,
-            description="Ambiguous English music query"
-        ),
-        AccuracyTestCase(
-            input_text="Food",
-            expected_tool="clarification_needed",
-            expected_intent=ToolIntent.FOOD_LOCATION,  # Intent unclear but likely food
-            language=Language.ENGLISH,
-            description="Ambiguous English food query"
-        ),
-    ]
+    return list(_build_demo_test_cases())
 
 def main():
     """Main demo function"""
@@ -317,17 +246,22 @@ def main():
     logger.info(f"📝 Created {len(test_cases)} test cases across 3 languages")
     logger.info("")
     
+    # Run each model once over all cases; the tests below only score the results
+    texts = [case.input_text for case in test_cases]
+    semantic_decisions = router.route_to_tool_batch(texts)
+    intent_predictions, intent_error = predict_intents(intent_classifier, texts)
+    
     # Run all tests
     results = {}
     
     # Test 1: Intent Classification (Primary approach)
-    results['intent'] = test_intent_classification(intent_classifier, test_cases)
+    results['intent'] = test_intent_classification(intent_predictions, intent_error, test_cases)
     
     # Test 2: Semantic Embedding (Backup approach)
-    results['semantic'] = test_semantic_routing(router, test_cases)
+    results['semantic'] = test_semantic_routing(semantic_decisions, test_cases)
     
     # Test 3: Hybrid Approach
-    results['hybrid'] = test_hybrid_approach(router, intent_classifier, test_cases)
+    results['hybrid'] = test_hybrid_approach(semantic_decisions, intent_predictions, intent_error, test_cases)
     
     # Summary
     logger.info("\n📈 FINAL COMPARISON RESULTS")
@@ -337,8 +271,7 @@ def main():
     logger.info(f"🔀 Hybrid Approach:                 {results['hybrid']:.1f}%")
     
     # Determine best approach
-    best_method = max(results, key=results.get)
-    best_accuracy = results[best_method]
+    best_method, best_accuracy = max(results.items(), key=itemgetter(1))
     
     logger.info(f"\n🏆 BEST PERFORMING METHOD: {best_method.upper()} ({best_accuracy:.1f}%)")
     
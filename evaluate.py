@@ -87,11 +87,15 @@ class HybridRoutingEvaluator:
         results = []
         routing_method_counts = defaultdict(int)
         
-        for i, example in enumerate(test_data):
+        # Run both models over every input up front; execution_time adds each
+        # example's share of that batch time
+        embeddings, predictions, time_share = self.router.infer_batch([example['text'] for example in test_data])
+        
+        for i, (example, prediction, embedding) in enumerate(zip(test_data, predictions, embeddings)):
             start_time = time.time()
             
             # Route using hybrid system
-            decision = self.router.route_to_tool(example['text'])
+            decision = self.router.route_to_tool(example['text'], intent_prediction=prediction, input_embedding=embedding)
             
             # Check correctness
             is_correct = decision.selected_tool == example['tool']
@@ -103,7 +107,7 @@ class HybridRoutingEvaluator:
                 'example': example,
                 'decision': decision,
                 'is_correct': is_correct,
-                'execution_time': time.time() - start_time,
+                'execution_time': time.time() - start_time + time_share,
                 'routing_method': decision.routing_method,
                 'classifier_confidence': decision.classifier_confidence,
                 'semantic_similarity': decision.semantic_similarity
@@ -213,9 +217,10 @@ class HybridRoutingEvaluator:
         
         results = []
         
-        for test in test_queries:
-            decision = self.router.route_to_tool(test['query'])
-            
+        # Encode every query in one batch, then route against the warm cache
+        decisions = self.router.route_to_tool_batch([test['query'] for test in test_queries])
+        
+        for test, decision in zip(test_queries, decisions):
             is_correct_tool = decision.selected_tool == test['expected_tool']
             is_correct_intent = (
                 decision.predicted_intent is not None and 
@@ -4,6 +4,7 @@ Multilingual Intent Classifier for MCP Tool Routing
 Uses transformers for training and inference on Hindi+English+Hinglish data
 """
 
+import contextlib
 import json
 import os
 import numpy as np
@@ -17,7 +18,7 @@ from sklearn.metrics import accuracy_score, classification_report, confusion_mat
 from typing import List, Dict, Tuple
 import logging
 from models import ToolIntent
-from data import IntentDatasetGenerator
+from data import IntentDatasetGenerator, label_distribution
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -38,18 +39,18 @@ class IntentDataset(Dataset):
         text = str(self.texts[idx])
         label = self.labels[idx]
         
+        # No padding here: DataCollatorWithPadding pads each batch only to its
+        # longest example instead of every example to max_length
         encoding = self.tokenizer(
             text,
             truncation=True,
-            padding='max_length',
-            max_length=self.max_length,
-            return_tensors='pt'
+            max_length=self.max_length
         )
         
         return {
-            'input_ids': encoding['input_ids'].flatten(),
-            'attention_mask': encoding['attention_mask'].flatten(),
-            'labels': torch.tensor(label, dtype=torch.long)
+            'input_ids': encoding['input_ids'],
+            'attention_mask': encoding['attention_mask'],
+            'labels': label
         }
 
 class MultilingualIntentClassifier:
@@ -143,6 +144,7 @@ class MultilingualIntentClassifier:
             save_total_limit=3,  # Keep only best 3 models
             dataloader_drop_last=False,  # Don't drop incomplete batches
             fp16=False,  # Disable for stability on smaller datasets
+            group_by_length=True,  # Batch similar lengths together to minimize padding
         )
         
         # Trainer
@@ -210,6 +212,12 @@ class MultilingualIntentClassifier:
         self.model.eval()
         logger.info(f"Model loaded from {model_dir}")
     
+    def _autocast(self):
+        """Half-precision autocast on CUDA; CPU inference stays in float32"""
+        if self.model.device.type == 'cuda':
+            return torch.autocast(device_type='cuda', dtype=torch.float16)
+        return contextlib.nullcontext()
+    
     def predict(self, text: str) -> Tuple[ToolIntent, float]:
         """Predict intent for a single text"""
         if self.model is None or self.tokenizer is None:
@@ -222,10 +230,10 @@ class MultilingualIntentClassifier:
             padding=True,
             max_length=128,
             return_tensors='pt'
-        )
+        ).to(self.model.device)
         
         # Predict
-        with torch.no_grad():
+        with torch.inference_mode(), self._autocast():
             outputs = self.model(**inputs)
             logits = outputs.logits
             probabilities = torch.softmax(logits, dim=-1)
@@ -238,12 +246,34 @@ class MultilingualIntentClassifier:
             
         return predicted_intent, confidence
     
-    def predict_batch(self, texts: List[str]) -> List[Tuple[ToolIntent, float]]:
-        """Predict intents for multiple texts"""
+    def predict_batch(self, texts: List[str], batch_size: int = 32) -> List[Tuple[ToolIntent, float]]:
+        """Predict intents for multiple texts, one padded forward pass per batch"""
+        if self.model is None or self.tokenizer is None:
+            raise ValueError("Model not loaded. Call load_model() first.")
+        
         results = []
-        for text in texts:
-            intent, confidence = self.predict(text)
-            results.append((intent, confidence))
+        for start in range(0, len(texts), batch_size):
+            # Tokenize the batch, padding only to its longest text
+            inputs = self.tokenizer(
+                list(texts[start:start + batch_size]),
+                truncation=True,
+                padding=True,
+                max_length=128,
+                return_tensors='pt'
+            ).to(self.model.device)
+            
+            # Predict
+            with torch.inference_mode(), self._autocast():
+                outputs = self.model(**inputs)
+                probabilities = torch.softmax(outputs.logits, dim=-1)
+                
+                # Max over the probabilities gives confidence and label together
+                confidences, predicted_labels = probabilities.max(dim=-1)
+            
+            results.extend(
+                (self.label_to_intent[label], confidence)
+                for label, confidence in zip(predicted_labels.tolist(), confidences.tolist())
+            )
         return results
     
     def evaluate_on_test_data(self, test_data: List[Dict]) -> Dict:
@@ -253,14 +283,12 @@ class MultilingualIntentClassifier:
         
         texts, true_labels = self.prepare_training_data(test_data)
         
-        # Get predictions
+        # Get predictions in batched forward passes
         predictions = []
         confidences = []
         
-        for text in texts:
-            intent, confidence = self.predict(text)
-            pred_label = self.intent_to_label[intent]
-            predictions.append(pred_label)
+        for intent, confidence in self.predict_batch(texts):
+            predictions.append(self.intent_to_label[intent])
             confidences.append(confidence)
         
         # Calculate metrics
@@ -308,13 +336,7 @@ def train_intent_classifier():
         logger.info(f"Generated {len(training_data)} training examples")
     
     # Print dataset statistics
-    intent_counts = {}
-    language_counts = {}
-    for example in training_data:
-        intent = example['intent']
-        language = example['language']
-        intent_counts[intent] = intent_counts.get(intent, 0) + 1
-        language_counts[language] = language_counts.get(language, 0) + 1
+    intent_counts, language_counts = label_distribution(training_data)
     
     logger.info("📊 Training Dataset Statistics:")
     logger.info("Intent Distribution:")
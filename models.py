@@ -1,6 +1,7 @@
-from pydantic import BaseModel
-from typing import List, Optional, Dict, Any
+from pydantic import BaseModel, ConfigDict, field_validator
+from typing import List, Optional, Dict, Any, Tuple
 from enum import Enum
+import sys
 import time
 
 class ToolIntent(str, Enum):
@@ -10,6 +11,16 @@ class ToolIntent(str, Enum):
     MUSIC_RECOMMENDATION = "music_recommendation"
     FOOD_LOCATION = "food_location"
 
+# Keyed by intent value; ToolIntent is a str enum, so members hash and compare
+# equal to these keys and can be used for lookups directly
+INTENT_TO_TOOL: Dict[str, str] = {
+    ToolIntent.RECIPE_SUGGESTION.value: "leftover_chef",
+    ToolIntent.STORY_TELLING.value: "nani_kahaniyan",
+    ToolIntent.POEM_GENERATION.value: "poem_generator",
+    ToolIntent.MUSIC_RECOMMENDATION.value: "vividh_bharti",
+    ToolIntent.FOOD_LOCATION.value: "food_locator"
+}
+
 class Language(str, Enum):
     HINDI = "hindi"
     ENGLISH = "english"
@@ -66,11 +77,33 @@ class RouteDecision(BaseModel):
     predicted_intent: Optional[ToolIntent] = None
 
 class AccuracyTestCase(BaseModel):
+    # Test cases are static fixtures: freezing makes them hashable so they can
+    # be shared between runs and deduplicated in sets
+    model_config = ConfigDict(frozen=True)
+    
     input_text: str
     expected_tool: str
     expected_intent: ToolIntent
     language: Language
     description: str
+    
+    @field_validator("expected_tool")
+    @classmethod
+    def _intern_tool(cls, value: str) -> str:
+        # Only five tool names exist; share one str object per name across cases
+        return sys.intern(value)
+    
+    @classmethod
+    def from_row(cls, row: Tuple[str, str, str, str, str]) -> "AccuracyTestCase":
+        """Build a case from an (input_text, expected_tool, expected_intent, language, description) row"""
+        input_text, expected_tool, expected_intent, language, description = row
+        return cls(
+            input_text=input_text,
+            expected_tool=expected_tool,
+            expected_intent=expected_intent,
+            language=language,
+            description=description
+        )
 
 class EvaluationResult(BaseModel):
     test_case: AccuracyTestCase
@@ -1,6 +1,7 @@
 from sentence_transformers import SentenceTransformer
 import numpy as np
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Tuple
+from functools import lru_cache
 import re
 import time
 from models import *
@@ -9,6 +10,133 @@ import os
 
 logger = logging.getLogger(__name__)
 
+# Upper bound on cached input embeddings per router (384 floats each)
+EMBEDDING_CACHE_SIZE = 4096
+
+# Upper bound on memoized language detections, shared by all routers
+LANGUAGE_CACHE_SIZE = 4096
+
+# Expanded Hinglish words (Roman Hindi and common code-switching)
+HINGLISH_WORDS = (
+    # Basic words
+    'ghar', 'mein', 'hai', 'kuch', 'batao', 'karo', 'yaar', 'paas', 'koi', 'achha', 'sunao', 'bacchon', 'gaane', 'purane',
+    # Action words
+    'banana', 'khana', 'recipe', 'story', 'kavita', 'poem', 'dhaba', 'restaurant', 'nearby',
+    # Common expressions
+    'kya', 'hai', 'se', 'ka', 'ki', 'ko', 'mera', 'tera', 'aur', 'bhi', 'toh', 'wala', 'wali',
+    # Question words
+    'kahan', 'kaise', 'kyun', 'kab', 'kitna', 'kaun',
+    # Food related
+    'dal', 'chawal', 'roti', 'sabzi', 'leftover', 'bacha', 'hua',
+    # Entertainment
+    'music', 'songs', 'kahani', 'poetry', 'shayari',
+    # Common particles
+    'bhi', 'toh', 'na', 'ho', 'kar', 'ke', 'liye', 'chahiye', 'milega',
+    # Expressions
+    'achhi', 'accha', 'bura', 'burra', 'bahut', 'thoda', 'zyada', 'kam'
+)
+
+# Language detection regexes, compiled once instead of on every call
+DEVANAGARI_CHAR_RE = re.compile(r'[\u0900-\u097F]')
+LATIN_CHAR_RE = re.compile(r'[a-zA-Z]')
+HINGLISH_PATTERN_RE = re.compile(
+    r'\b(kya|koi|kuch|kahan|kaise|kyun)\b'   # Question words
+    r'|\b(hai|hain|tha|thi|the)\b'           # Verbs
+    r'|\b(aur|bhi|toh|wala|wali)\b'          # Connectors
+    r'|\b(mein|se|ka|ki|ko|ke|liye)\b'       # Prepositions
+    r'|\b(batao|karo|sunao|dena|lena)\b'     # Commands
+)
+# Substring match against any Hinglish word in one C-level scan per word;
+# dict.fromkeys drops the repeated entries while keeping their order
+HINGLISH_WORD_RE = re.compile('|'.join(map(re.escape, dict.fromkeys(HINGLISH_WORDS))))
+
+@lru_cache(maxsize=LANGUAGE_CACHE_SIZE)
+def _detect_language(text: str) -> Language:
+    """Detect the primary language of input text, memoized per string"""
+    text_lower = text.lower()
+    
+    # Count different character types
+    hindi_chars = len(DEVANAGARI_CHAR_RE.findall(text))
+    english_chars = len(LATIN_CHAR_RE.findall(text))
+    total_chars = len(text.replace(' ', ''))
+    
+    # Count Hinglish words more sophisticated way
+    words_in_text = text_lower.split()
+    hinglish_word_count = sum(1 for word in words_in_text if HINGLISH_WORD_RE.search(word))
+    
+    # Check for common Hinglish patterns (question words, verbs,
+    # connectors, prepositions, commands) in one scan
+    has_hinglish_pattern = HINGLISH_PATTERN_RE.search(text_lower) is not None
+    
+    if total_chars == 0:
+        return Language.ENGLISH
+    
+    hindi_ratio = hindi_chars / total_chars
+    english_ratio = english_chars / total_chars
+    
+    # Enhanced Hinglish detection
+    is_hinglish = (
+        hinglish_word_count > 0 or                               # Contains Hinglish words
+        has_hinglish_pattern or                                  # Matches Hinglish patterns
+        (hindi_ratio > 0.05 and english_ratio > 0.3) or        # Mixed script
+        (hindi_ratio > 0.1 and english_ratio > 0.1)            # Any mix of scripts
+    )
+    
+    if is_hinglish:
+        return Language.HINGLISH
+    elif hindi_ratio > 0.7:
+        return Language.HINDI
+    elif english_ratio > 0.9:
+        return Language.ENGLISH
+    else:
+        return Language.MIXED
+
+# Router evaluation cases as (input_text, expected_tool, expected_intent, language, description)
+# rows; AccuracyTestCase models are only built when the dataset is requested
+TEST_CASE_ROWS = (
+    # Recipe Tool Tests
+    ("What can I cook with leftover rice and dal?", "leftover_chef", ToolIntent.RECIPE_SUGGESTION, Language.ENGLISH, "English recipe query"),
+    ("Ghar mein sirf chawal aur dal hai, kuch recipe batao", "leftover_chef", ToolIntent.RECIPE_SUGGESTION, Language.HINGLISH, "Hinglish recipe query"),
+    ("बचे हुए खाने से क्या बना सकते हैं?", "leftover_chef", ToolIntent.RECIPE_SUGGESTION, Language.HINDI, "Hindi recipe query"),
+    ("Leftover roti se kya banau?", "leftover_chef", ToolIntent.RECIPE_SUGGESTION, Language.HINGLISH, "Leftover roti query"),
+
+    # Story Tool Tests
+    ("Tell me a bedtime story", "nani_kahaniyan", ToolIntent.STORY_TELLING, Language.ENGLISH, "English bedtime story"),
+    ("Bacchon ko sunane ke liye koi achhi kahani batao", "nani_kahaniyan", ToolIntent.STORY_TELLING, Language.HINGLISH, "Hinglish children story"),
+    ("कोई नैतिक कहानी सुनाइए", "nani_kahaniyan", ToolIntent.STORY_TELLING, Language.HINDI, "Hindi moral story"),
+    ("Story with moral sunao", "nani_kahaniyan", ToolIntent.STORY_TELLING, Language.HINGLISH, "Hinglish moral story"),
+
+    # Poem Tool Tests
+    ("Write a beautiful poem", "poem_generator", ToolIntent.POEM_GENERATION, Language.ENGLISH, "English poem request"),
+    ("Koi achhi kavita sunao", "poem_generator", ToolIntent.POEM_GENERATION, Language.HINGLISH, "Hinglish poem request"),
+    ("प्रेम पर कविता लिखिए", "poem_generator", ToolIntent.POEM_GENERATION, Language.HINDI, "Hindi love poem"),
+    ("Romantic poetry batao", "poem_generator", ToolIntent.POEM_GENERATION, Language.HINGLISH, "Hinglish romantic poem"),
+
+    # Music Tool Tests
+    ("Suggest some old classic songs", "vividh_bharti", ToolIntent.MUSIC_RECOMMENDATION, Language.ENGLISH, "English music request"),
+    ("Purane gaane recommend karo", "vividh_bharti", ToolIntent.MUSIC_RECOMMENDATION, Language.HINGLISH, "Hinglish music request"),
+    ("कुछ पुराने गाने बताइए", "vividh_bharti", ToolIntent.MUSIC_RECOMMENDATION, Language.HINDI, "Hindi music request"),
+    ("1900s ke nostalgic songs batao", "vividh_bharti", ToolIntent.MUSIC_RECOMMENDATION, Language.HINGLISH, "Nostalgic songs request"),
+
+    # Food Location Tests
+    ("Good restaurants near me", "food_locator", ToolIntent.FOOD_LOCATION, Language.ENGLISH, "English restaurant search"),
+    ("Yahan ke paas koi achha dhaba hai?", "food_locator", ToolIntent.FOOD_LOCATION, Language.HINGLISH, "Hinglish dhaba search"),
+    ("पास में खाने की जगह बताइए", "food_locator", ToolIntent.FOOD_LOCATION, Language.HINDI, "Hindi food place search"),
+    ("Nearby food places batao", "food_locator", ToolIntent.FOOD_LOCATION, Language.HINGLISH, "Hinglish food search"),
+
+    # Additional challenging Hinglish test cases
+    ("Purane gaane recommend karo yaar", "vividh_bharti", ToolIntent.MUSIC_RECOMMENDATION, Language.HINGLISH, "Challenging Hinglish music request"),
+    ("Koi achhi si kavita sunao na", "poem_generator", ToolIntent.POEM_GENERATION, Language.HINGLISH, "Casual Hinglish poem request"),
+    ("Bacchon ke liye moral story batao", "nani_kahaniyan", ToolIntent.STORY_TELLING, Language.HINGLISH, "Hinglish children story request"),
+    ("Dal chawal se kya banana hai", "leftover_chef", ToolIntent.RECIPE_SUGGESTION, Language.HINGLISH, "Specific Hinglish recipe query"),
+    ("Yahan ka food scene kaisa hai", "food_locator", ToolIntent.FOOD_LOCATION, Language.HINGLISH, "Complex Hinglish food inquiry"),
+)
+
+@lru_cache(maxsize=1)
+def _build_test_cases() -> Tuple[AccuracyTestCase, ...]:
+    """Materialize TEST_CASE_ROWS once; the frozen models are safe to share"""
+    return tuple(map(AccuracyTestCase.from_row, TEST_CASE_ROWS))
+
 # Lazy import for intent classifier to avoid circular imports
 _intent_classifier = None
 
@@ -37,6 +165,7 @@ class MultilingualToolRouter:
         self.tools_metadata = self._initialize_tool_metadata()
         self.evaluation_history: List[EvaluationResult] = []
         self.route_history: List[RouteDecision] = []
+        self._embedding_cache: Dict[str, np.ndarray] = {}
         
         # Pre-compute embeddings for tool descriptions
         self._precompute_tool_embeddings()
@@ -133,7 +262,7 @@ class MultilingualToolRouter:
     
     def _precompute_tool_embeddings(self):
         """Pre-compute embeddings for all tool descriptions and keywords"""
-        self.tool_embeddings = {}
+        combined_texts = {}
         
         for tool_name, metadata in self.tools_metadata.items():
             # Combine all descriptions and keywords for comprehensive matching
@@ -160,79 +289,64 @@ class MultilingualToolRouter:
             
             combined_text += " " + " ".join(hinglish_context)
             
-            self.tool_embeddings[tool_name] = self.model.encode(combined_text)
-    
-    def detect_language(self, text: str) -> Language:
-        """Detect the primary language of input text"""
-        # Expanded Hinglish words (Roman Hindi and common code-switching)
-        hinglish_words = [
-            # Basic words
-            'ghar', 'mein', 'hai', 'kuch', 'batao', 'karo', 'yaar', 'paas', 'koi', 'achha', 'sunao', 'bacchon', 'gaane', 'purane',
-            # Action words
-            'banana', 'khana', 'recipe', 'story', 'kavita', 'poem', 'dhaba', 'restaurant', 'nearby',
-            # Common expressions
-            'kya', 'hai', 'se', 'ka', 'ki', 'ko', 'mera', 'tera', 'aur', 'bhi', 'toh', 'wala', 'wali',
-            # Question words
-            'kahan', 'kaise', 'kyun', 'kab', 'kitna', 'kaun',
-            # Food related
-            'dal', 'chawal', 'roti', 'sabzi', 'leftover', 'bacha', 'hua',
-            # Entertainment
-            'music', 'songs', 'kahani', 'poetry', 'shayari',
-            # Common particles
-            'bhi', 'toh', 'na', 'ho', 'kar', 'ke', 'liye', 'chahiye', 'milega',
-            # Expressions
-            'achhi', 'accha', 'bura', 'burra', 'bahut', 'thoda', 'zyada', 'kam'
-        ]
-        
-        text_lower = text.lower()
+            combined_texts[tool_name] = combined_text
         
-        # Count different character types
-        hindi_chars = len(re.findall(r'[\u0900-\u097F]', text))
-        english_chars = len(re.findall(r'[a-zA-Z]', text))
-        total_chars = len(text.replace(' ', ''))
+        # Encode all tool descriptions in a single batched forward pass
+        embeddings = self.model.encode(list(combined_texts.values()), show_progress_bar=False)
+        self.tool_embeddings = dict(zip(combined_texts, embeddings))
         
-        # Count Hinglish words more sophisticated way
-        words_in_text = text_lower.split()
-        hinglish_word_count = sum(1 for word in words_in_text if any(hw in word for hw in hinglish_words))
-        
-        # Check for common Hinglish patterns
-        hinglish_patterns = [
-            r'\b(kya|koi|kuch|kahan|kaise|kyun)\b',  # Question words
-            r'\b(hai|hain|tha|thi|the)\b',           # Verbs
-            r'\b(aur|bhi|toh|wala|wali)\b',          # Connectors
-            r'\b(mein|se|ka|ki|ko|ke|liye)\b',       # Prepositions
-            r'\b(batao|karo|sunao|dena|lena)\b'      # Commands
-        ]
-        
-        pattern_matches = sum(1 for pattern in hinglish_patterns if re.search(pattern, text_lower))
-        
-        if total_chars == 0:
-            return Language.ENGLISH
-        
-        hindi_ratio = hindi_chars / total_chars
-        english_ratio = english_chars / total_chars
-        
-        # Enhanced Hinglish detection
-        is_hinglish = (
-            hinglish_word_count > 0 or                               # Contains Hinglish words
-            pattern_matches > 0 or                                   # Matches Hinglish patterns
-            (hindi_ratio > 0.05 and english_ratio > 0.3) or        # Mixed script
-            (hindi_ratio > 0.1 and english_ratio > 0.1)            # Any mix of scripts
-        )
+        # Stack unit-normalized tool vectors so a single matrix-vector product
+        # scores an input against every tool
+        self._tool_names = list(self.tool_embeddings)
+        tool_matrix = np.stack([self.tool_embeddings[name] for name in self._tool_names])
+        self._tool_matrix = tool_matrix / np.linalg.norm(tool_matrix, axis=1, keepdims=True)
+    
+    def _tool_similarities(self, input_embedding: np.ndarray) -> np.ndarray:
+        """Cosine similarity of an input embedding to every tool, in _tool_names order"""
+        return self._tool_matrix @ input_embedding / np.linalg.norm(input_embedding)
+    
+    def _encode_input(self, text: str) -> np.ndarray:
+        """Encode user input, reusing the embedding if this text was seen before"""
+        embedding = self._embedding_cache.get(text)
+        if embedding is None:
+            embedding = self.model.encode(text)
+            self._cache_embedding(text, embedding)
+        return embedding
+    
+    def _cache_embedding(self, text: str, embedding: np.ndarray):
+        """Store an input embedding, evicting the oldest entry when the cache is full"""
+        if len(self._embedding_cache) >= EMBEDDING_CACHE_SIZE:
+            # Dicts keep insertion order, so the first key is the oldest
+            del self._embedding_cache[next(iter(self._embedding_cache))]
+        self._embedding_cache[text] = embedding
+    
+    def encode_inputs(self, texts: List[str], batch_size: int = 64) -> List[np.ndarray]:
+        """Embeddings for texts in order, batch-encoding those not already cached
         
-        if is_hinglish:
-            return Language.HINGLISH
-        elif hindi_ratio > 0.7:
-            return Language.HINDI
-        elif english_ratio > 0.9:
-            return Language.ENGLISH
-        else:
-            return Language.MIXED
+        The result is returned directly rather than through the bounded cache,
+        so batches larger than EMBEDDING_CACHE_SIZE are not evicted before use.
+        """
+        pending = [text for text in dict.fromkeys(texts) if text not in self._embedding_cache]
+        encoded = {}
+        if pending:
+            embeddings = self.model.encode(pending, batch_size=batch_size, show_progress_bar=False)
+            encoded = dict(zip(pending, embeddings))
+        return [encoded[text] if text in encoded else self._embedding_cache[text] for text in texts]
+    
+    def detect_language(self, text: str) -> Language:
+        """Detect the primary language of input text"""
+        return _detect_language(text)
     
-    def route_to_tool(self, user_input: str, return_confidence: bool = True) -> RouteDecision:
+    def route_to_tool(self, user_input: str, return_confidence: bool = True,
+                      intent_prediction: Optional[Tuple[ToolIntent, float]] = None,
+                      input_embedding: Optional[np.ndarray] = None) -> RouteDecision:
         """
         Hybrid routing: Intent classifier first, then semantic similarity fallback
         
+        intent_prediction, when given, is a precomputed (intent, confidence) from
+        the classifier and skips its per-input forward pass; input_embedding does
+        the same for the sentence encoder.
+        
         Steps:
         1. Try intent classifier with confidence >= 0.55
         2. If classifier confidence < 0.55, fallback to semantic similarity
@@ -256,20 +370,14 @@ class MultilingualToolRouter:
         
         if intent_classifier is not None:
             try:
-                predicted_intent, classifier_confidence = intent_classifier.predict(user_input)
+                if intent_prediction is None:
+                    intent_prediction = intent_classifier.predict(user_input)
+                predicted_intent, classifier_confidence = intent_prediction
                 
                 # Check if classifier confidence is high enough
                 if classifier_confidence >= 0.55:
                     # Map intent to tool
-                    intent_to_tool_map = {
-                        ToolIntent.RECIPE_SUGGESTION: "leftover_chef",
-                        ToolIntent.STORY_TELLING: "nani_kahaniyan",
-                        ToolIntent.POEM_GENERATION: "poem_generator",
-                        ToolIntent.MUSIC_RECOMMENDATION: "vividh_bharti",
-                        ToolIntent.FOOD_LOCATION: "food_locator"
-                    }
-                    
-                    selected_tool = intent_to_tool_map.get(predicted_intent)
+                    selected_tool = INTENT_TO_TOOL.get(predicted_intent)
                     confidence_score = classifier_confidence
                     routing_method = "classifier"
                     reasoning = f"Intent classifier: {predicted_intent.value} (confidence: {classifier_confidence:.3f})"
@@ -282,19 +390,16 @@ class MultilingualToolRouter:
         # Step 2: Fallback to Semantic Similarity if classifier didn't work or confidence too low
         if selected_tool is None:
             # Get embedding for user input
-            input_embedding = self.model.encode(user_input)
+            if input_embedding is None:
+                input_embedding = self._encode_input(user_input)
             
             # Calculate similarities with all tools
-            similarities = {}
-            for tool_name, tool_embedding in self.tool_embeddings.items():
-                similarity = np.dot(input_embedding, tool_embedding) / (
-                    np.linalg.norm(input_embedding) * np.linalg.norm(tool_embedding)
-                )
-                similarities[tool_name] = similarity
+            similarities = self._tool_similarities(input_embedding)
             
             # Find best match
-            best_tool = max(similarities, key=similarities.get)
-            best_similarity = similarities[best_tool]
+            best_index = int(np.argmax(similarities))
+            best_tool = self._tool_names[best_index]
+            best_similarity = similarities[best_index]
             
             # Check if confidence meets threshold with language-specific adjustments
             tool_metadata = self.tools_metadata[best_tool]
@@ -340,11 +445,10 @@ class MultilingualToolRouter:
         
         # Calculate semantic similarity for logging even if classifier was used
         if routing_method == "classifier":
-            input_embedding = self.model.encode(user_input)
-            tool_embedding = self.tool_embeddings[selected_tool]
-            semantic_similarity = np.dot(input_embedding, tool_embedding) / (
-                np.linalg.norm(input_embedding) * np.linalg.norm(tool_embedding)
-            )
+            if input_embedding is None:
+                input_embedding = self._encode_input(user_input)
+            similarities = self._tool_similarities(input_embedding)
+            semantic_similarity = similarities[self._tool_names.index(selected_tool)]
         else:
             semantic_similarity = confidence_score if routing_method != "clarification" else best_similarity
         
@@ -366,15 +470,55 @@ class MultilingualToolRouter:
         
         return decision
     
+    def predict_intents_batch(self, user_inputs: List[str]) -> List[Optional[Tuple[ToolIntent, float]]]:
+        """Classify several inputs in batched forward passes
+        
+        Entries are None when no classifier is loaded or the batch fails, in
+        which case route_to_tool falls back to predicting per input.
+        """
+        predictions = [None] * len(user_inputs)
+        intent_classifier = get_intent_classifier()
+        if intent_classifier is not None and user_inputs:
+            try:
+                predictions = intent_classifier.predict_batch(user_inputs)
+            except Exception as e:
+                logger.warning(f"⚠️  Batch classifier prediction failed: {e}")
+        return predictions
+    
+    def infer_batch(self, user_inputs: List[str], batch_size: int = 64
+                    ) -> Tuple[List[np.ndarray], List[Optional[Tuple[ToolIntent, float]]], float]:
+        """Run the encoder and classifier over all inputs in batched forward passes
+        
+        Returns the embeddings, the intent predictions and the batch time divided
+        evenly across inputs, so per-input timings can still include inference.
+        """
+        start_time = time.time()
+        embeddings = self.encode_inputs(user_inputs, batch_size=batch_size)
+        predictions = self.predict_intents_batch(user_inputs)
+        time_share = (time.time() - start_time) / len(user_inputs) if user_inputs else 0.0
+        return embeddings, predictions, time_share
+    
+    def route_to_tool_batch(self, user_inputs: List[str], batch_size: int = 64) -> List[RouteDecision]:
+        """Route several inputs, running the encoder and classifier in batched forward passes"""
+        embeddings, predictions, _ = self.infer_batch(user_inputs, batch_size=batch_size)
+        return [
+            self.route_to_tool(user_input, intent_prediction=prediction, input_embedding=embedding)
+            for user_input, prediction, embedding in zip(user_inputs, predictions, embeddings)
+        ]
+    
     def evaluate_accuracy(self, test_cases: List[AccuracyTestCase]) -> AccuracyMetrics:
         """Evaluate routing accuracy on a set of test cases"""
         results = []
         
-        for test_case in test_cases:
+        # Run both models over every input up front; execution_time adds each
+        # case's share of that batch time
+        embeddings, predictions, time_share = self.infer_batch([test_case.input_text for test_case in test_cases])
+        
+        for test_case, prediction, embedding in zip(test_cases, predictions, embeddings):
             start_time = time.time()
             
             # Route the test input
-            decision = self.route_to_tool(test_case.input_text)
+            decision = self.route_to_tool(test_case.input_text, intent_prediction=prediction, input_embedding=embedding)
             
             # Check if prediction is correct
             is_correct = decision.selected_tool == test_case.expected_tool
@@ -385,7 +529,7 @@ class MultilingualToolRouter:
                 confidence_score=decision.confidence_score,
                 is_correct=is_correct,
                 reasoning=decision.reasoning,
-                execution_time=time.time() - start_time
+                execution_time=time.time() - start_time + time_share
             )
             
             results.append(result)
@@ -479,41 +623,4 @@ class MultilingualToolRouter:
     
     def get_test_dataset(self) -> List[AccuracyTestCase]:
         """Generate comprehensive test dataset for evaluation"""
-        return [
-            # Recipe Tool Tests
-            AccuracyTestCase(input_text="What can I cook with leftover rice and dal?", expected_tool="leftover_chef", expected_intent=ToolIntent.RECIPE_SUGGESTION, language=Language.ENGLISH, description="English recipe query"),
-            AccuracyTestCase(input_text="Ghar mein sirf chawal aur dal hai, kuch recipe batao", expected_tool="leftover_chef", expected_intent=ToolIntent.RECIPE_SUGGESTION, language=Language.HINGLISH, description="Hinglish recipe query"),
-            AccuracyTestCase(input_text="बचे हुए खाने से क्या बना सकते हैं?", expected_tool="leftover_chef", expected_intent=ToolIntent.RECIPE_SUGGESTION, language=Language.HINDI, description="Hindi recipe query"),
-            AccuracyTestCase(input_text="Leftover roti se kya banau?", expected_tool="leftover_chef", expected_intent=ToolIntent.RECIPE_SUGGESTION, language=Language.HINGLISH, description="Leftover roti query"),
-            
-            # Story Tool Tests  
-            AccuracyTestCase(input_text="Tell me a bedtime story", expected_tool="nani_kahaniyan", expected_intent=ToolIntent.STORY_TELLING, language=Language.ENGLISH, description="English bedtime story"),
-            AccuracyTestCase(input_text="Bacchon ko sunane ke liye koi achhi kahani batao", expected_tool="nani_kahaniyan", expected_intent=ToolIntent.STORY_TELLING, language=Language.HINGLISH, description="Hinglish children story"),
-            AccuracyTestCase(input_text="कोई नैतिक कहानी सुनाइए", expected_tool="nani_kahaniyan", expected_intent=ToolIntent.STORY_TELLING, language=Language.HINDI, description="Hindi moral story"),
-            AccuracyTestCase(input_text="Story with moral sunao", expected_tool="nani_kahaniyan", expected_intent=ToolIntent.STORY_TELLING, language=Language.HINGLISH, description="Hinglish moral story"),
-            
-            # Poem Tool Tests
-            AccuracyTestCase(input_text="Write a beautiful poem", expected_tool="poem_generator", expected_intent=ToolIntent.POEM_GENERATION, language=Language.ENGLISH, description="English poem request"),
-            AccuracyTestCase(input_text="Koi achhi kavita sunao", expected_tool="poem_generator", expected_intent=ToolIntent.POEM_GENERATION, language=Language.HINGLISH, description="Hinglish poem request"),
-            AccuracyTestCase(input_text="प्रेम पर कविता लिखिए", expected_tool="poem_generator", expected_intent=ToolIntent.POEM_GENERATION, language=Language.HINDI, description="Hindi love poem"),
-            AccuracyTestCase(input_text="Romantic poetry batao", expected_tool="poem_generator", expected_intent=ToolIntent.POEM_GENERATION, language=Language.HINGLISH, description="Hinglish romantic poem"),
-            
-            # Music Tool Tests
-            AccuracyTestCase(input_text="Suggest some old classic songs", expected_tool="vividh_bharti", expected_intent=ToolIntent.MUSIC_RECOMMENDATION, language=Language.ENGLISH, description="English music request"),
-            AccuracyTestCase(input_text="Purane gaane recommend karo", expected_tool="vividh_bharti", expected_intent=ToolIntent.MUSIC_RECOMMENDATION, language=Language.HINGLISH, description="Hinglish music request"),
-            AccuracyTestCase(input_text="कुछ पुराने गाने बताइए", expected_tool="vividh_bharti", expected_intent=ToolIntent.MUSIC_RECOMMENDATION, language=Language.HINDI, description="Hindi music request"),
-            AccuracyTestCase(input_text="1900s ke nostalgic songs batao", expected_tool="vividh_bharti", expected_intent=ToolIntent.MUSIC_RECOMMENDATION, language=Language.HINGLISH, description="Nostalgic songs request"),
-            
-            # Food Location Tests
-            AccuracyTestCase(input_text="Good restaurants near me", expected_tool="food_locator", expected_intent=ToolIntent.FOOD_LOCATION, language=Language.ENGLISH, description="English restaurant search"),
-            AccuracyTestCase(input_text="Yahan ke paas koi achha dhaba hai?", expected_tool="food_locator", expected_intent=ToolIntent.FOOD_LOCATION, language=Language.HINGLISH, description="Hinglish dhaba search"),
-            AccuracyTestCase(input_text="पास में खाने की जगह बताइए", expected_tool="food_locator", expected_intent=ToolIntent.FOOD_LOCATION, language=Language.HINDI, description="Hindi food place search"),
-            AccuracyTestCase(input_text="Nearby food places batao", expected_tool="food_locator", expected_intent=ToolIntent.FOOD_LOCATION, language=Language.HINGLISH, description="Hinglish food search"),
-            
-            # Additional challenging Hinglish test cases
-            AccuracyTestCase(input_text="Purane gaane recommend karo yaar", expected_tool="vividh_bharti", expected_intent=ToolIntent.MUSIC_RECOMMENDATION, language=Language.HINGLISH, description="Challenging Hinglish music request"),
-            AccuracyTestCase(input_text="Koi achhi si kavita sunao na", expected_tool="poem_generator", expected_intent=ToolIntent.POEM_GENERATION, language=Language.HINGLISH, description="Casual Hinglish poem request"),
-            AccuracyTestCase(input_text="Bacchon ke liye moral story batao", expected_tool="nani_kahaniyan", expected_intent=ToolIntent.STORY_TELLING, language=Language.HINGLISH, description="Hinglish children story request"),
-            AccuracyTestCase(input_text="Dal chawal se kya banana hai", expected_tool="leftover_chef", expected_intent=ToolIntent.RECIPE_SUGGESTION, language=Language.HINGLISH, description="Specific Hinglish recipe query"),
-            AccuracyTestCase(input_text="Yahan ka food scene kaisa hai", expected_tool="food_locator", expected_intent=ToolIntent.FOOD_LOCATION, language=Language.HINGLISH, description="Complex Hinglish food inquiry"),
-        ] 
\ No newline at end of file
+        return list(_build_test_cases())